@@ -16,6 +16,7 @@ from ConfigSpace.exceptions import (
 )
 
 from libc.stdlib cimport malloc, free
+from libc.math cimport exp, isfinite, rint
 cimport numpy as np
 
 # We now need to fix a datatype for our arrays. I've used the variable
@@ -46,6 +47,7 @@ cpdef int check_configuration(
     cdef str hp_name
     cdef Hyperparameter hyperparameter
     cdef int hyperparameter_idx
+    cdef int hp_idx
     cdef DTYPE_t hp_value
     cdef int add
     cdef ConditionComponent condition
@@ -54,11 +56,12 @@ cpdef int check_configuration(
     cdef list children
     cdef set inactive
     cdef set visited
+    cdef dict hyperparameter_to_idx = self._hyperparameter_idx
 
-    cdef int* active
-    active = <int*> malloc(sizeof(int) * len(vector))
-    for i in range(len(vector)):
-        active[i] = 0
+    # Kept as a numpy array so that the check for inactive hyperparameters with a
+    # value at the end can be done for all hyperparameters at once
+    cdef np.ndarray active_array = np.zeros(len(vector), dtype=np.uint8)
+    cdef np.uint8_t[:] active = active_array
 
     unconditional_hyperparameters = self.get_all_unconditional_hyperparameters()
     to_visit = deque()
@@ -67,17 +70,19 @@ cpdef int check_configuration(
     inactive = set()
 
     for ch in unconditional_hyperparameters:
-        active[self._hyperparameter_idx[ch]] = 1
+        hyperparameter_idx = hyperparameter_to_idx[ch]
+        active[hyperparameter_idx] = 1
 
     while len(to_visit) > 0:
         hp_name = to_visit.pop()
         visited.add(hp_name)
-        hp_idx = self._hyperparameter_idx[hp_name]
+        hp_idx = hyperparameter_to_idx[hp_name]
         hyperparameter = self._hyperparameters[hp_name]
         hp_value = vector[hp_idx]
 
-        if not np.isnan(hp_value) and not hyperparameter.is_legal_vector(hp_value):
-            free(active)
+        # `hp_value == hp_value` is false only for NaN on the C double, so the legality
+        # of values which are not set is not checked
+        if hp_value == hp_value and not hyperparameter.is_legal_vector(hp_value):
             raise IllegalValueError(hyperparameter, hp_value)
 
         children = self._children_of[hp_name]
@@ -91,24 +96,20 @@ cpdef int check_configuration(
                         inactive.add(child.name)
                         break
                 if add:
-                    hyperparameter_idx = self._hyperparameter_idx[child.name]
+                    hyperparameter_idx = hyperparameter_to_idx[child.name]
                     active[hyperparameter_idx] = 1
                     to_visit.appendleft(child.name)
 
-        if active[hp_idx] and np.isnan(hp_value):
-            free(active)
+        if active[hp_idx] and hp_value != hp_value:
             raise ActiveHyperparameterNotSetError(hyperparameter)
 
-    for hp_idx in self._idx_to_hyperparameter:
-
-        if not allow_inactive_with_values and not active[hp_idx] and not np.isnan(vector[hp_idx]):
-            # Only look up the value (in the line above) if the hyperparameter is inactive!
+    if not allow_inactive_with_values:
+        inactive_with_value = np.flatnonzero((active_array == 0) & ~np.isnan(vector))
+        if len(inactive_with_value) > 0:
+            hp_idx = inactive_with_value[0]
             hp_name = self._idx_to_hyperparameter[hp_idx]
-            hp_value = vector[hp_idx]
-            free(active)
-            raise InactiveHyperparameterSetError(hyperparameter, hp_value)
+            raise InactiveHyperparameterSetError(self._hyperparameters[hp_name], vector[hp_idx])
 
-    free(active)
     self._check_forbidden(vector)
 
 
@@ -353,3 +354,121 @@ cpdef np.ndarray change_hp_value(
             configuration_array[idx] = NaN
 
     return configuration_array
+
+
+cpdef np.ndarray fill_vector_numeric(
+    np.ndarray[DTYPE_t, ndim=1] vector,
+    np.ndarray[np.intp_t, ndim=1] indices,
+    np.ndarray[DTYPE_t, ndim=1] values,
+    np.ndarray[DTYPE_t, ndim=1] lowers,
+    np.ndarray[DTYPE_t, ndim=1] uppers,
+):
+    """Write the unit-cube representation of uniform numerical values into a vector.
+
+    This is the numerical part of ``_inverse_transform`` of
+    ``UniformFloatHyperparameter`` and ``UniformIntegerHyperparameter``,
+    done for many hyperparameters in a single typed loop. Values of
+    hyperparameters on a log-scale must already be passed as ``np.log(value)``
+    so that the result is identical to ``_inverse_transform``.
+
+    Parameters
+    ----------
+    vector : np.ndarray
+        The configuration array to write into
+
+    indices : np.ndarray
+        Index into ``vector`` for each value
+
+    values : np.ndarray
+        The (possibly log-transformed) values to write
+
+    lowers : np.ndarray
+        ``_lower`` of each hyperparameter, indexed like ``vector``
+
+    uppers : np.ndarray
+        ``_upper`` of each hyperparameter, indexed like ``vector``
+
+    Returns
+    -------
+    np.ndarray
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t idx
+    cdef DTYPE_t value
+
+    for i in range(indices.shape[0]):
+        idx = indices[i]
+        value = (values[i] - lowers[idx]) / (uppers[idx] - lowers[idx])
+        if value > 1.0:
+            value = 1.0
+        if value < 0.0:
+            value = 0.0
+        vector[idx] = value
+
+    return vector
+
+
+cpdef object transform_numeric(DTYPE_t value, tuple params):
+    """Transform a unit-cube value of a uniform numerical hyperparameter.
+
+    This is ``_transform_scalar`` of ``UniformFloatHyperparameter`` and
+    ``UniformIntegerHyperparameter`` without going through the hyperparameter
+    object, the result is identical.
+
+    Parameters
+    ----------
+    value : float
+        The finite value from the configuration array
+
+    params : tuple
+        ``(_lower, _upper, log, q, lower, upper, is_int)`` of the hyperparameter,
+        where ``q`` is NaN if the hyperparameter is not quantized
+
+    Returns
+    -------
+    float | int
+    """
+    cdef DTYPE_t _lower = params[0]
+    cdef DTYPE_t _upper = params[1]
+    cdef bint log = params[2]
+    cdef DTYPE_t q = params[3]
+    cdef DTYPE_t lower = params[4]
+    cdef DTYPE_t upper = params[5]
+    cdef bint is_int = params[6]
+
+    value = value * (_upper - _lower) + _lower
+    if log:
+        value = exp(value)
+    if q == q:
+        value = rint((value - lower) / q) * q + lower
+
+    # Same tie-breaking as ``min(upper, max(lower, value))``
+    if not value > lower:
+        value = lower
+    if not value < upper:
+        value = upper
+
+    if is_int:
+        return <long long>rint(value)
+    return value
+
+
+cpdef list active_indices(np.ndarray[DTYPE_t, ndim=1] vector):
+    """Positions of all finite, i.e. active, entries of a configuration array.
+
+    Parameters
+    ----------
+    vector : np.ndarray
+
+    Returns
+    -------
+    list[int]
+    """
+    cdef Py_ssize_t i
+    cdef list indices = []
+
+    for i in range(vector.shape[0]):
+        if isfinite(vector[i]):
+            indices.append(i)
+
+    return indices
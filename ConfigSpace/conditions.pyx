@@ -26,7 +26,6 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import io
 import copy
 from itertools import combinations
 from typing import Any, List, Union, Tuple, Dict
@@ -670,14 +669,7 @@ cdef class AndConjunction(AbstractConjunction):
         super(AndConjunction, self).__init__(*args)
 
     def __repr__(self) -> str:
-        retval = io.StringIO()
-        retval.write("(")
-        for idx, component in enumerate(self.components):
-            retval.write(str(component))
-            if idx < len(self.components) - 1:
-                retval.write(" && ")
-        retval.write(")")
-        return retval.getvalue()
+        return "(" + " && ".join(map(str, self.components)) + ")"
 
     cdef int _evaluate_vector(self, np.ndarray instantiated_vector):
         cdef ConditionComponent component
@@ -731,14 +723,7 @@ cdef class OrConjunction(AbstractConjunction):
         super(OrConjunction, self).__init__(*args)
 
     def __repr__(self) -> str:
-        retval = io.StringIO()
-        retval.write("(")
-        for idx, component in enumerate(self.components):
-            retval.write(str(component))
-            if idx < len(self.components) - 1:
-                retval.write(" || ")
-        retval.write(")")
-        return retval.getvalue()
+        return "(" + " || ".join(map(str, self.components)) + ")"
 
     cdef int _evaluate(self, int I, int* evaluations):
         for i in range(I):
@@ -1,19 +1,60 @@
 from __future__ import annotations
 
+import math
 import warnings
-from typing import TYPE_CHECKING, Any, Iterator, KeysView, Mapping, Sequence
+from collections.abc import Mapping as MappingABC
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    Sequence,
+    ValuesView,
+)
 
 import numpy as np
 
 from ConfigSpace import c_util
 from ConfigSpace.exceptions import HyperparameterNotFoundError, IllegalValueError
-from ConfigSpace.hyperparameters import FloatHyperparameter
 
 if TYPE_CHECKING:
     from ConfigSpace.configuration_space import ConfigurationSpace
 
+# Marks a position of `Configuration._values` whose value was not computed yet
+_NOT_SET = object()
+
+
+# The attributes of a `Configuration` which are pickled as they are. Of the caches only
+# `_values` is pickled, see `Configuration.__getstate__`.
+_PICKLED_SLOTS = (
+    "config_space",
+    "allow_inactive_with_values",
+    "origin",
+    "config_id",
+    "_vector",
+)
+
+
+# NOTE: `Configuration` acts like a `Mapping` but does not inherit from it, all of the
+# mapping methods are implemented directly on top of the vector instead of going through
+# the generic `__iter__` / `__getitem__` based ones. It is registered as a virtual
+# subclass of `Mapping` at the bottom of this file.
+class Configuration:
+    __slots__ = (
+        "config_space",
+        "allow_inactive_with_values",
+        "origin",
+        "config_id",
+        "_values",
+        "_vector",
+        "_repr",
+        "_hash",
+        "_active",
+        "__weakref__",
+    )
 
-class Configuration(Mapping[str, Any]):
     def __init__(
         self,
         configuration_space: ConfigurationSpace,
@@ -63,8 +104,14 @@ class Configuration(Mapping[str, Any]):
         self.config_id = config_id
 
         # This is cached. When it's None, it means it needs to be relaoaded
-        # which is primarly handled in __getitem__.
-        self._values: dict[str, Any] | None = None
+        # which is primarly handled in __getitem__. It is indexed by the position
+        # of a hyperparameter in the space, values not computed yet are `_NOT_SET`.
+        self._values: list[Any] | None = None
+
+        # Also cached and only reset when a value is changed through __setitem__
+        self._repr: str | None = None
+        self._hash: int | None = None
+        self._active: list[int] | None = None
 
         # Will be set below
         self._vector: np.ndarray
@@ -74,30 +121,78 @@ class Configuration(Mapping[str, Any]):
             if any(unknown_keys):
                 raise ValueError(f"Unknown hyperparameter(s) {unknown_keys}")
 
-            # Using cs._hyperparameters to iterate makes sure that the hyperparameters in
-            # the configuration are sorted in the same way as they are sorted in
-            # the configuration space
-            self._values = {}
-            self._vector = np.ndarray(shape=len(configuration_space), dtype=float)
-
-            for i, (key, hp) in enumerate(configuration_space.items()):
-                value = values.get(key)
+            # Only the provided keys are visited, their vector values are gathered
+            # into a buffer and scattered into the vector in a single step. Anything
+            # not provided (or None) stays NaN, the representation of inactive.
+            # Uniform numerical hyperparameters are not transformed one by one but
+            # collected and handed to `c_util.fill_vector_numeric` in one go.
+            hyperparameters = configuration_space._hyperparameters
+            hyperparameter_idx = configuration_space._hyperparameter_idx
+            is_float = configuration_space._is_float
+            is_uniform = configuration_space._is_uniform
+            indices = np.empty(len(values), dtype=np.intp)
+            vector_values = np.empty(len(values), dtype=float)
+            numeric_indices = np.empty(len(values), dtype=np.intp)
+            numeric_values = np.empty(len(values), dtype=float)
+            n_set = 0
+            n_numeric = 0
+
+            self._values = [_NOT_SET] * len(configuration_space)
+            for key, value in values.items():
                 if value is None:
-                    self._vector[i] = np.nan  # By default, represent None values as NaN
                     continue
 
+                hp = hyperparameters[key]
                 if not hp.is_legal(value):
                     raise IllegalValueError(hp, value)
 
-                # Truncate the float to be of constant length for a python version
-                if isinstance(hp, FloatHyperparameter):
-                    value = float(repr(value))
-
-                self._values[key] = value
-                self._vector[i] = hp._inverse_transform(value)
+                idx = hyperparameter_idx[key]
+
+                # Truncate the float to be of constant length for a python version.
+                # A python float already round trips through its repr unchanged.
+                if is_float[idx] and type(value) is not float:
+                    legal_value = float(repr(value))
+                else:
+                    legal_value = value
+
+                self._values[idx] = legal_value
+                if is_uniform[idx]:
+                    numeric_indices[n_numeric] = idx
+                    numeric_values[n_numeric] = legal_value
+                    n_numeric += 1
+                else:
+                    indices[n_set] = idx
+                    vector_values[n_set] = hp._inverse_transform(legal_value)
+                    n_set += 1
+
+            self._vector = np.full(len(configuration_space), np.nan, dtype=float)
+            self._vector[indices[:n_set]] = vector_values[:n_set]
+
+            if n_numeric > 0:
+                numeric_indices = numeric_indices[:n_numeric]
+                numeric_values = numeric_values[:n_numeric]
+                is_log = configuration_space._is_log[numeric_indices]
+                numeric_values[is_log] = np.log(numeric_values[is_log])
+                c_util.fill_vector_numeric(
+                    self._vector,
+                    numeric_indices,
+                    numeric_values,
+                    configuration_space._lowers,
+                    configuration_space._uppers,
+                )
 
             self.is_valid_configuration()
 
+        elif (
+            isinstance(vector, np.ndarray)
+            and vector.dtype == np.float64
+            and vector.ndim == 1
+            and vector.flags.c_contiguous
+            and len(vector) == len(configuration_space)
+        ):
+            # Fast path for vectors as they are produced by sampling and optimizers
+            self._vector = vector
+
         elif vector is not None:
             _vector = np.asarray(vector, dtype=float)
 
@@ -117,7 +212,42 @@ class Configuration(Mapping[str, Any]):
                     f"Expected array of length {n_hyperparameters}, got {len(_vector)}",
                 )
 
-            self._vector = _vector
+            # The compiled kernels in c_util expect contiguous memory
+            self._vector = np.ascontiguousarray(_vector)
+
+    @classmethod
+    def from_matrix(
+        cls,
+        configuration_space: ConfigurationSpace,
+        matrix: np.ndarray,
+        origin: Any | None = None,
+    ) -> list[Configuration]:
+        """Create one configuration per row of a matrix of vectors.
+
+        The matrix is converted and checked once, each configuration then
+        holds a view on its row instead of a copy. Like for ``vector`` in
+        ``__init__``, the rows are not checked for validity.
+
+        Parameters
+        ----------
+        configuration_space : :class:`~ConfigSpace.configuration_space.ConfigurationSpace`
+        matrix : np.ndarray
+            Array of shape (n_configurations, n_hyperparameters) in vector representation
+        origin : Any, optional
+            Store information about the origin of these configurations. Defaults to None
+
+        Returns
+        -------
+        list[:class:`~ConfigSpace.configuration_space.Configuration`]
+            The configurations, one for each row of ``matrix``
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != len(configuration_space):
+            raise ValueError(
+                f"Expected array of shape (n, {len(configuration_space)}), got {matrix.shape}",
+            )
+
+        return [cls(configuration_space, vector=row, origin=origin) for row in matrix]
 
     def is_valid_configuration(self) -> None:
         """Check if the object is a valid.
@@ -144,11 +274,61 @@ class Configuration(Mapping[str, Any]):
         """
         return self._vector
 
+    def _active_indices(self) -> list[int]:
+        # Positions of all active hyperparameters, found with one pass over the vector
+        # and kept until the vector is replaced in __setitem__
+        if self._active is None:
+            self._active = c_util.active_indices(self._vector)
+        return self._active
+
+    def _materialize_all(self, active: list[int] | None = None) -> list[Any]:
+        # Fill the cache of values for all active hyperparameters which are not in it yet
+        if active is None:
+            active = self._active_indices()
+
+        if self._values is None:
+            self._values = [_NOT_SET] * len(self._vector)
+
+        values = self._values
+        missing = [idx for idx in active if values[idx] is _NOT_SET]
+        if not missing:
+            return values
+
+        config_space = self.config_space
+        names = config_space._hyperparameter_names
+        is_float = config_space._is_float
+        transform_params = config_space._transform_params
+        hyperparameters = config_space._hyperparameters
+
+        for idx, raw_value in zip(missing, self._vector[missing].tolist()):
+            params = transform_params[idx]
+            if params is not None:
+                values[idx] = c_util.transform_numeric(raw_value, params)
+                continue
+
+            value = hyperparameters[names[idx]]._transform(raw_value)
+
+            # Truncate float to be of constant length for a python version
+            if is_float[idx] and type(value) is not float:
+                value = float(repr(value))
+
+            values[idx] = value
+
+        return values
+
+    def _as_dict(self) -> dict[str, Any]:
+        # All active values, in the order of the configuration space
+        active = self._active_indices()
+        values = self._materialize_all(active)
+        names = self.config_space._hyperparameter_names
+        return {names[idx]: values[idx] for idx in active}
+
     def __contains__(self, item: object) -> bool:
         if not isinstance(item, str):
             return False
 
-        return item in self
+        idx = self.config_space._hyperparameter_idx.get(item)
+        return idx is not None and math.isfinite(self._vector.item(idx))
 
     def __setitem__(self, key: str, value: Any) -> None:
         param = self.config_space[key]
@@ -161,7 +341,7 @@ class Configuration(Mapping[str, Any]):
         vector_value = param._inverse_transform(value)
         new_array = c_util.change_hp_value(
             self.config_space,
-            self.get_array().copy(),
+            self._vector.copy(),
             param.name,
             vector_value,
             idx,
@@ -171,18 +351,24 @@ class Configuration(Mapping[str, Any]):
         # Reset cached items
         self._vector = new_array
         self._values = None
+        self._repr = None
+        self._hash = None
+        self._active = None
 
     def __getitem__(self, key: str) -> Any:
-        if self._values is not None and key in self._values:
-            return self._values[key]
-
-        if key not in self.config_space:
+        item_idx = self.config_space._hyperparameter_idx.get(key)
+        if item_idx is None:
             raise HyperparameterNotFoundError(key, space=self.config_space)
 
-        item_idx = self.config_space._hyperparameter_idx[key]
+        if self._values is not None:
+            value = self._values[item_idx]
+            if value is not _NOT_SET:
+                return value
 
-        raw_value = self._vector[item_idx]
-        if not np.isfinite(raw_value):
+        # `.item()` gives a python float, which `math.isfinite` checks without going
+        # through numpy's scalar machinery
+        raw_value = self._vector.item(item_idx)
+        if not math.isfinite(raw_value):
             # NOTE: Techinically we could raise an `InactiveHyperparameterError` here
             # but that causes the `.get()` method from being a mapping to fail.
             # Normally `config.get(key)`, if it fails, will return None. Apparently,
@@ -190,17 +376,23 @@ class Configuration(Mapping[str, Any]):
             # from it.
             raise KeyError(key)
 
-        hyperparameter = self.config_space._hyperparameters[key]
-        value = hyperparameter._transform(raw_value)
+        # Uniform float and integer hyperparameters are transformed without going
+        # through the hyperparameter, this already gives a python float or int
+        params = self.config_space._transform_params[item_idx]
+        if params is not None:
+            value = c_util.transform_numeric(raw_value, params)
+        else:
+            hyperparameter = self.config_space._hyperparameters[key]
+            value = hyperparameter._transform(raw_value)
 
-        # Truncate float to be of constant length for a python version
-        if isinstance(hyperparameter, FloatHyperparameter):
-            value = float(repr(value))
+            # Truncate float to be of constant length for a python version
+            if self.config_space._is_float[item_idx] and type(value) is not float:
+                value = float(repr(value))
 
         if self._values is None:
-            self._values = {}
+            self._values = [_NOT_SET] * len(self._vector)
 
-        self._values[key] = value
+        self._values[item_idx] = value
         return value
 
     def keys(self) -> KeysView[str]:
@@ -211,34 +403,117 @@ class Configuration(Mapping[str, Any]):
         KeysView[str]
             The keys of the configuration
         """
-        d = {
-            key: self._vector[idx]
-            for idx, key in enumerate(self.config_space.keys())
-            if np.isfinite(self._vector[idx])
-        }
-        return d.keys()
+        # The values are almost always looked up after the keys, e.g. by `dict(config)`,
+        # so we fill the cache here in one go instead of key by key in __getitem__
+        return self._as_dict().keys()
+
+    def values(self) -> ValuesView[Any]:
+        """Return the values of the configuration.
+
+        Returns
+        -------
+        ValuesView[Any]
+            The values of the configuration
+        """
+        return self._as_dict().values()
+
+    def items(self) -> ItemsView[str, Any]:
+        """Return the (key, value) pairs of the configuration.
+
+        Returns
+        -------
+        ItemsView[str, Any]
+            The items of the configuration
+        """
+        return self._as_dict().items()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for ``key`` if it is active, else ``default``.
+
+        Parameters
+        ----------
+        key : str
+            The name of the hyperparameter
+        default : Any, optional
+            What to return if the hyperparameter is inactive. Defaults to None
+
+        Returns
+        -------
+        Any
+            The value of the hyperparameter or ``default``
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
-            return dict(self) == dict(other) and self.config_space == other.config_space
+            # The values are compared and not the vectors, which are not canonical,
+            # see __hash__. Comparing the spaces is skipped when they are the same object.
+            same_space = self.config_space is other.config_space
+            return self._as_dict() == other._as_dict() and (
+                same_space or self.config_space == other.config_space
+            )
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.__repr__())
+        if self._hash is None:
+            # Hash the values and not the vector, the vector is not canonical. A value
+            # given to __init__ and the same value sampled can have different vectors.
+            self._hash = hash(frozenset(self._as_dict().items()))
+        return self._hash
 
     def __repr__(self) -> str:
-        values = dict(self)
-        header = "Configuration(values={"
-        lines = [f"  '{key}': {repr(values[key])}," for key in sorted(values.keys())]
-        end = "})"
-        return "\n".join([header, *lines, end])
+        if self._repr is None:
+            values = self._as_dict()
+            header = "Configuration(values={"
+            lines = [f"  '{key}': {repr(values[key])}," for key in sorted(values.keys())]
+            end = "})"
+            self._repr = "\n".join([header, *lines, end])
+        return self._repr
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.keys())
+        names = self.config_space._hyperparameter_names
+        for idx in self._active_indices():
+            yield names[idx]
 
     def __len__(self) -> int:
         return len(self.config_space)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached repr, hash and active positions are not pickled. Hashes of strings
+        # and bytes differ between processes, a stale hash would break set and dict
+        # lookups after unpickling in another process.
+        state = {name: getattr(self, name) for name in _PICKLED_SLOTS}
+
+        # The cached values are kept, values given to __init__ need not be equal to the
+        # transformed vector. `_NOT_SET` would not be the same object after unpickling
+        # or copying, so only the positions which are set are stored.
+        if self._values is None:
+            state["_values"] = None
+        else:
+            state["_values"] = {
+                idx: value for idx, value in enumerate(self._values) if value is not _NOT_SET
+            }
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name in _PICKLED_SLOTS:
+            setattr(self, name, state[name])
+
+        cached_values = state["_values"]
+        if cached_values is None:
+            self._values = None
+        else:
+            self._values = [_NOT_SET] * len(self._vector)
+            for idx, value in cached_values.items():
+                self._values[idx] = value
+
+        self._repr = None
+        self._hash = None
+        self._active = None
+
     # ------------ Marked Deprecated --------------------
     # Probably best to only remove these once we actually
     # make some other breaking changes
@@ -262,3 +537,6 @@ class Configuration(Mapping[str, Any]):
         return dict(self)
 
     # ---------------------------------------------------
+
+
+MappingABC.register(Configuration)
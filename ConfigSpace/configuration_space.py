@@ -30,6 +30,7 @@ from __future__ import annotations
 import contextlib
 import copy
 import io
+import sys
 import warnings
 from collections import OrderedDict, defaultdict, deque
 from itertools import chain
@@ -69,6 +70,7 @@ from ConfigSpace.forbidden import (
 from ConfigSpace.hyperparameters import (
     CategoricalHyperparameter,
     Constant,
+    FloatHyperparameter,
     Hyperparameter,
     UniformFloatHyperparameter,
     UniformIntegerHyperparameter,
@@ -76,6 +78,19 @@ from ConfigSpace.hyperparameters import (
 
 _ROOT: Final = "__HPOlib_configuration_space_root__"
 
+# Per-hyperparameter arrays derived from `_hyperparameters`, indexed like a vector.
+# These are rebuilt whenever hyperparameters are added or resorted and are not part
+# of the identity of a space.
+_ARRAY_CACHE: Final = (
+    "_hyperparameter_names",
+    "_is_float",
+    "_is_uniform",
+    "_is_log",
+    "_lowers",
+    "_uppers",
+    "_transform_params",
+)
+
 
 def _parse_hyperparameters_from_dict(items: dict[str, Any]) -> Iterator[Hyperparameter]:
     for name, hp in items.items():
@@ -219,6 +234,15 @@ class ConfigurationSpace(Mapping[str, Hyperparameter]):
         self._parents_of: dict[str, list[Hyperparameter]] = {}
         self._children_of: dict[str, list[Hyperparameter]] = {}
 
+        self._hyperparameter_names: tuple[str, ...]
+        self._is_float: np.ndarray
+        self._is_uniform: np.ndarray
+        self._is_log: np.ndarray
+        self._lowers: np.ndarray
+        self._uppers: np.ndarray
+        self._transform_params: tuple[tuple | None, ...]
+        self._update_array_cache()
+
         if space is not None:
             hyperparameters = list(_parse_hyperparameters_from_dict(space))
             self.add_hyperparameters(hyperparameters)
@@ -1123,9 +1147,11 @@ class ConfigurationSpace(Mapping[str, Hyperparameter]):
         """Override the default Equals behavior."""
         if isinstance(other, self.__class__):
             this_dict = self.__dict__.copy()
-            del this_dict["random"]
             other_dict = other.__dict__.copy()
-            del other_dict["random"]
+            # The array caches may be missing, e.g. for spaces pickled by older versions
+            for key in ("random", *_ARRAY_CACHE):
+                this_dict.pop(key, None)
+                other_dict.pop(key, None)
             return this_dict == other_dict
         return NotImplemented
 
@@ -1185,7 +1211,9 @@ class ConfigurationSpace(Mapping[str, Hyperparameter]):
         return len(self._hyperparameters)
 
     def _add_hyperparameter(self, hyperparameter: Hyperparameter) -> None:
-        hp_name = hyperparameter.name
+        # All name-keyed lookups (and the keys of a configuration) share this one
+        # interned string, so most dictionary probes succeed on identity alone
+        hp_name = sys.intern(hyperparameter.name)
 
         existing = self._hyperparameters.get(hp_name)
         if existing is not None:
@@ -1256,6 +1284,7 @@ class ConfigurationSpace(Mapping[str, Hyperparameter]):
         for i, hp in enumerate(self._hyperparameters):
             self._hyperparameter_idx[hp] = i
             self._idx_to_hyperparameter[i] = hp
+        self._update_array_cache()
 
         # Update order of _children
         new_order = OrderedDict()
@@ -1389,6 +1418,45 @@ class ConfigurationSpace(Mapping[str, Hyperparameter]):
         }
         self._parents_of = {name: self.get_parents_of(name) for name in self._hyperparameters}
         self._children_of = {name: self.get_children_of(name) for name in self._hyperparameters}
+        self._update_array_cache()
+
+    def _update_array_cache(self) -> None:
+        # Struct-of-arrays view of the hyperparameters, indexed like a vector, so that
+        # `Configuration` can work on its vector without looking up hyperparameters.
+        # Uniform float and integer hyperparameters share the same linear (or log-linear)
+        # mapping to the unit cube, which lets `Configuration` vectorize it through
+        # `c_util.fill_vector_numeric` instead of calling `_inverse_transform` per value.
+        # The other direction goes through `c_util.transform_numeric` with the
+        # parameters of `_transform_scalar` gathered in `_transform_params`.
+        n_hyperparameters = len(self._hyperparameters)
+        self._hyperparameter_names = tuple(self._hyperparameters)
+        self._is_float = np.array(
+            [isinstance(hp, FloatHyperparameter) for hp in self._hyperparameters.values()],
+            dtype=bool,
+        )
+        self._is_uniform = np.zeros(n_hyperparameters, dtype=bool)
+        self._is_log = np.zeros(n_hyperparameters, dtype=bool)
+        self._lowers = np.full(n_hyperparameters, np.nan, dtype=float)
+        self._uppers = np.full(n_hyperparameters, np.nan, dtype=float)
+        transform_params: list[tuple | None] = [None] * n_hyperparameters
+
+        for i, hp in enumerate(self._hyperparameters.values()):
+            if type(hp) in (UniformFloatHyperparameter, UniformIntegerHyperparameter):
+                self._is_uniform[i] = True
+                self._is_log[i] = hp.log
+                self._lowers[i] = hp._lower
+                self._uppers[i] = hp._upper
+                transform_params[i] = (
+                    float(hp._lower),
+                    float(hp._upper),
+                    bool(hp.log),
+                    float(hp.q) if hp.q is not None else np.nan,
+                    float(hp.lower),
+                    float(hp.upper),
+                    type(hp) is UniformIntegerHyperparameter,
+                )
+
+        self._transform_params = tuple(transform_params)
 
     def _check_forbidden_component(self, clause: AbstractForbiddenComponent) -> None:
         _assert_type(clause, AbstractForbiddenComponent, "_check_forbidden_component")
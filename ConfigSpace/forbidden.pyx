@@ -28,7 +28,6 @@
 
 import copy
 import numpy as np
-import io
 from ConfigSpace.hyperparameters import Hyperparameter
 from ConfigSpace.hyperparameters.hyperparameter cimport Hyperparameter
 from typing import Dict, Any, Union
@@ -340,8 +339,10 @@ cdef class AbstractForbiddenConjunction(AbstractForbiddenComponent):
         if self.n_components != other.n_components:
             return False
 
-        return all([self.components[i] == other.components[i]
-                    for i in range(self.n_components)])
+        for i in range(self.n_components):
+            if self.components[i] != other.components[i]:
+                return False
+        return True
 
     cpdef set_vector_idx(self, hyperparameter_to_idx):
         for component in self.components:
@@ -442,14 +443,7 @@ cdef class ForbiddenAndConjunction(AbstractForbiddenConjunction):
     """
 
     def __repr__(self) -> str:
-        retval = io.StringIO()
-        retval.write("(")
-        for idx, component in enumerate(self.components):
-            retval.write(str(component))
-            if idx < len(self.components) - 1:
-                retval.write(" && ")
-        retval.write(")")
-        return retval.getvalue()
+        return "(" + " && ".join(map(str, self.components)) + ")"
 
     cdef int _is_forbidden(self, int I, int* evaluations):
         # Return False if one of the components evaluates to False
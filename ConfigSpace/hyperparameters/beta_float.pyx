@@ -1,4 +1,3 @@
-import io
 import warnings
 from typing import Any, Dict, Union, Optional
 
@@ -78,15 +77,15 @@ cdef class BetaFloatHyperparameter(UniformFloatHyperparameter):
         self.normalized_default_value = self._inverse_transform(self.default_value)
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: BetaFloat, Alpha: %s Beta: %s, Range: [%s, %s], Default: %s" % (self.name, repr(self.alpha), repr(self.beta), repr(self.lower), repr(self.upper), repr(self.default_value)))
-
+        repr_str = (
+            f"{self.name}, Type: BetaFloat, Alpha: {self.alpha!r} Beta: {self.beta!r}, "
+            f"Range: [{self.lower!r}, {self.upper!r}], Default: {self.default_value!r}"
+        )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % str(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q}"
+        return repr_str
 
     def __eq__(self, other: Any) -> bool:
         """
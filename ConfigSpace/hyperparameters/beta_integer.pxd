@@ -12,10 +12,11 @@ DTYPE = float
 ctypedef np.float_t DTYPE_t
 
 from ConfigSpace.hyperparameters.uniform_integer cimport UniformIntegerHyperparameter
+from ConfigSpace.hyperparameters.beta_float cimport BetaFloatHyperparameter
 
 
 cdef class BetaIntegerHyperparameter(UniformIntegerHyperparameter):
     cdef public alpha
     cdef public beta
-    cdef public bfhp
+    cdef public BetaFloatHyperparameter bfhp
     cdef public normalization_constant
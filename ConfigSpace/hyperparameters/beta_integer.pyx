@@ -1,4 +1,3 @@
-import io
 from typing import Any, Dict, Optional, Union
 
 from scipy.stats import beta as spbeta
@@ -92,15 +91,15 @@ cdef class BetaIntegerHyperparameter(UniformIntegerHyperparameter):
         self.normalization_constant = self._compute_normalization()
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: BetaInteger, Alpha: %s Beta: %s, Range: [%s, %s], Default: %s" % (self.name, repr(self.alpha), repr(self.beta), repr(self.lower), repr(self.upper), repr(self.default_value)))
-
+        repr_str = (
+            f"{self.name}, Type: BetaInteger, Alpha: {self.alpha!r} Beta: {self.beta!r}, "
+            f"Range: [{self.lower!r}, {self.upper!r}], Default: {self.default_value!r}"
+        )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % str(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q}"
+        return repr_str
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -1,11 +1,11 @@
 from collections import Counter
 import copy
-import io
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN, floor, isfinite
 
 # We now need to fix a datatype for our arrays. I've used the variable
 # DTYPE for this, which is assigned to the usual NumPy runtime
@@ -19,6 +19,33 @@ ctypedef np.float_t DTYPE_t
 from ConfigSpace.hyperparameters.hyperparameter cimport Hyperparameter
 
 
+cdef np.ndarray _sample_neighbor_indices(Py_ssize_t num_choices, Py_ssize_t value,
+                                         double[:] uniforms):
+    """
+    Draw distinct indices from ``range(num_choices)`` except ``value``, one for each of the
+    given uniform random numbers in [0, 1).
+
+    This is a partial Fisher-Yates shuffle which only remembers the swapped positions, so
+    its cost depends on the number of drawn indices and not on ``num_choices``.
+    """
+    cdef Py_ssize_t number = uniforms.shape[0]
+    cdef Py_ssize_t num_candidates = num_choices - 1
+    cdef np.ndarray indices = np.empty(number, dtype=np.intp)
+    cdef np.intp_t[:] out = indices
+    cdef dict swapped = {}
+    cdef Py_ssize_t i, j, picked
+    for i in range(number):
+        j = i + <Py_ssize_t>(uniforms[i] * (num_candidates - i))
+        # Rounding can map uniforms just below one onto the upper end of the range
+        if j >= num_candidates:
+            j = num_candidates - 1
+        picked = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        # Skip the current value by shifting all candidates at or above it up by one
+        out[i] = picked + 1 if picked >= value else picked
+    return indices
+
+
 cdef class CategoricalHyperparameter(Hyperparameter):
     cdef public tuple choices
     cdef public tuple weights
@@ -26,6 +53,9 @@ cdef class CategoricalHyperparameter(Hyperparameter):
     cdef public tuple probabilities
     cdef list choices_vector
     cdef set _choices_set
+    cdef Py_hash_t _choices_hash
+    cdef dict _choice_to_idx
+    cdef np.ndarray _choices_array
 
     # TODO add more magic for automated type recognition
     # TODO move from list to tuple for choices argument
@@ -86,6 +116,10 @@ cdef class CategoricalHyperparameter(Hyperparameter):
             raise TypeError("Using a set of weights is prohibited as it can result in "
                             "non-deterministic behavior. Please use a list or a tuple.")
         self.choices = tuple(choices)
+        # Hashing the choices is linear in their number, they never change so this is
+        # only done once. Equality does not depend on the order of the choices, neither
+        # may the hash.
+        self._choices_hash = hash(frozenset(self.choices))
         if weights is not None:
             self.weights = tuple(weights)
         else:
@@ -94,24 +128,34 @@ cdef class CategoricalHyperparameter(Hyperparameter):
         self.num_choices = len(choices)
         self.choices_vector = list(range(self.num_choices))
         self._choices_set = set(self.choices_vector)
+        # Choices are hashable, the `Counter` above would have failed otherwise
+        self._choice_to_idx = {choice: idx for idx, choice in enumerate(self.choices)}
+        self._choices_array = None
+        choice_types = set(map(type, self.choices))
+        if choice_types == {int} or choice_types == {float}:
+            # Choices of a single numeric type are stored unboxed, unless numpy had to
+            # change their kind, e.g. for integers too large for int64
+            choices_array = np.array(self.choices)
+            if choices_array.dtype.kind in ("iu" if int in choice_types else "f"):
+                self._choices_array = choices_array
+        if self._choices_array is None:
+            # Element-wise so that choices which are sequences themselves stay single objects
+            self._choices_array = np.empty(self.num_choices, dtype=object)
+            for idx, choice in enumerate(self.choices):
+                self._choices_array[idx] = choice
         self.default_value = self.check_default(default_value)
         self.normalized_default_value = self._inverse_transform(self.default_value)
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: Categorical, Choices: {" % (self.name))
-        for idx, choice in enumerate(self.choices):
-            repr_str.write(str(choice))
-            if idx < len(self.choices) - 1:
-                repr_str.write(", ")
-        repr_str.write("}")
-        repr_str.write(", Default: ")
-        repr_str.write(str(self.default_value))
+        choices = ", ".join(map(str, self.choices))
+        repr_str = (
+            f"{self.name}, Type: Categorical, Choices: {{{choices}}}, "
+            f"Default: {self.default_value!s}"
+        )
         # if the probability distribution is not uniform, write out the probabilities
         if not np.all(self.probabilities == self.probabilities[0]):
-            repr_str.write(", Probabilities: %s" % str(self.probabilities))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Probabilities: {self.probabilities!s}"
+        return repr_str
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -128,6 +172,7 @@ cdef class CategoricalHyperparameter(Hyperparameter):
         """
         if not isinstance(other, self.__class__):
             return False
+        cdef CategoricalHyperparameter other_categorical = other
 
         if self.probabilities is not None:
             ordered_probabilities_self = {
@@ -138,8 +183,8 @@ cdef class CategoricalHyperparameter(Hyperparameter):
         if other.probabilities is not None:
             ordered_probabilities_other = {
                 choice: (
-                    other.probabilities[other.choices.index(choice)]
-                    if choice in other.choices else
+                    other.probabilities[other_categorical._choice_to_idx[choice]]
+                    if choice in other_categorical._choice_to_idx else
                     None
                 )
                 for choice in self.choices
@@ -166,7 +211,15 @@ cdef class CategoricalHyperparameter(Hyperparameter):
         )
 
     def __hash__(self):
-        return hash((self.name, self.choices))
+        return hash((self.name, self._choices_hash))
+
+    def __reduce__(self):
+        # Pickled by the constructor arguments so that the hash of the choices, which
+        # differs between processes, is computed again when unpickling
+        return (
+            CategoricalHyperparameter,
+            (self.name, self.choices, self.default_value, self.meta, self.weights),
+        )
 
     def __copy__(self):
         return CategoricalHyperparameter(
@@ -208,10 +261,11 @@ cdef class CategoricalHyperparameter(Hyperparameter):
             return 1
 
     def is_legal(self, value: Union[None, str, float, int]) -> bool:
-        if value in self.choices:
-            return True
-        else:
-            return False
+        try:
+            return value in self._choice_to_idx
+        except TypeError:
+            # Unhashable values such as single element arrays are compared one by one
+            return value in self.choices
 
     cpdef bint is_legal_vector(self, DTYPE_t value):
         return value in self._choices_set
@@ -252,18 +306,20 @@ cdef class CategoricalHyperparameter(Hyperparameter):
         if np.isnan(vector).any():
             raise ValueError('Vector %s contains NaN\'s' % vector)
 
-        if np.equal(np.mod(vector, 1), 0):
-            return self.choices[vector.astype(int)]
+        if np.equal(np.mod(vector, 1), 0).all():
+            return self._choices_array[vector.astype(np.intp)]
 
-        raise ValueError("Can only index the choices of the ordinal "
-                         "hyperparameter %s with an integer, but provided "
-                         "the following float: %f" % (self, vector))
+        raise ValueError("Can only index the choices of the categorical "
+                         "hyperparameter %s with integers, but provided "
+                         "the following floats: %s" % (self, vector))
 
     def _transform_scalar(self, scalar: Union[float, int]) -> Union[float, int, str]:
-        if scalar != scalar:
+        # Work on a C double, which avoids boxed float arithmetic in the checks below
+        cdef double value = scalar
+        if value != value:
             raise ValueError("Number %s is NaN" % scalar)
 
-        if scalar % 1 == 0:
+        if isfinite(value) and floor(value) == value:
             return self.choices[int(scalar)]
 
         raise ValueError("Can only index the choices of the ordinal "
@@ -273,7 +329,7 @@ cdef class CategoricalHyperparameter(Hyperparameter):
     def _transform(self, vector: Union[np.ndarray, float, int, str]
                    ) -> Optional[Union[np.ndarray, float, int]]:
         try:
-            if isinstance(vector, np.ndarray):
+            if isinstance(vector, np.ndarray) and vector.ndim >= 1:
                 return self._transform_vector(vector)
             return self._transform_scalar(vector)
         except ValueError:
@@ -281,8 +337,14 @@ cdef class CategoricalHyperparameter(Hyperparameter):
 
     def _inverse_transform(self, vector: Union[None, str, float, int]) -> Union[int, float]:
         if vector is None:
-            return np.NaN
-        return self.choices.index(vector)
+            return NAN
+        try:
+            return self._choice_to_idx[vector]
+        except KeyError:
+            raise ValueError("%s is not a choice of %s" % (repr(vector), self.name)) from None
+        except TypeError:
+            # Unhashable values such as single element arrays are compared one by one
+            return self.choices.index(vector)
 
     def has_neighbors(self) -> bool:
         return len(self.choices) > 1
@@ -293,36 +355,33 @@ cdef class CategoricalHyperparameter(Hyperparameter):
     def get_neighbors(self, value: int, rs: np.random.RandomState,
                       number: Union[int, float] = np.inf, transform: bool = False
                       ) -> List[Union[float, int, str]]:
+        index = int(value)
+        if self.num_choices == 2 and number >= 1:
+            # A binary choice has exactly one neighbor, the other choice. The random numbers
+            # the general path would use are still drawn, so that ``rs`` is left in the
+            # same state and seeded runs do not change.
+            if number < self.num_choices:
+                rs.random(size=int(number))
+            other = 1 - index
+            if transform:
+                return [self.choices[other]]
+            return [float(other)]
+
         neighbors = []  # type: List[Union[float, int, str]]
         if number < len(self.choices):
-            while len(neighbors) < number:
-                rejected = True
-                index = int(value)
-                while rejected:
-                    neighbor_idx = rs.randint(0, self.num_choices)
-                    if neighbor_idx != index:
-                        rejected = False
-
-                if transform:
-                    candidate = self._transform(neighbor_idx)
-                else:
-                    candidate = float(neighbor_idx)
-
-                if candidate in neighbors:
-                    continue
-                else:
-                    neighbors.append(candidate)
+            indices = _sample_neighbor_indices(
+                self.num_choices, index, rs.random(size=int(number))
+            )
+            if transform:
+                neighbors = [self.choices[idx] for idx in indices]
+            else:
+                neighbors = indices.astype(float).tolist()
         else:
-            for candidate_idx, candidate_value in enumerate(self.choices):
-                if int(value) == candidate_idx:
-                    continue
-                else:
-                    if transform:
-                        candidate = self._transform(candidate_idx)
-                    else:
-                        candidate = float(candidate_idx)
-
-                    neighbors.append(candidate)
+            if transform:
+                neighbors = list(self.choices[:index] + self.choices[index + 1:])
+            else:
+                neighbors = np.arange(self.num_choices, dtype=float).tolist()
+                del neighbors[index]
 
         return neighbors
 
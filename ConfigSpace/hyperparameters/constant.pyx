@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Union
 import numpy as np
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN
 
 # We now need to fix a datatype for our arrays. I've used the variable
 # DTYPE for this, which is assigned to the usual NumPy runtime
@@ -92,8 +93,10 @@ cdef class Constant(Hyperparameter):
     cpdef bint is_legal_vector(self, DTYPE_t value):
         return value == self.value_vector
 
-    def _sample(self, rs: None, size: Optional[int] = None) -> Union[int, np.ndarray]:
-        return 0 if size == 1 else np.zeros((size,))
+    def _sample(self, rs: None, size: Optional[int] = None) -> Union[float, np.ndarray]:
+        # Like the other hyperparameters, ``size=None`` gives a single value and any
+        # ``size`` an array, also ``size=1``
+        return 0.0 if size is None else np.zeros(size, dtype=float)
 
     def _transform(self, vector: Optional[Union[np.ndarray, float, int]]) \
             -> Optional[Union[np.ndarray, float, int]]:
@@ -110,7 +113,7 @@ cdef class Constant(Hyperparameter):
     def _inverse_transform(self, vector: Union[np.ndarray, float, int]
                            ) -> Union[np.ndarray, int, float]:
         if vector != self.value:
-            return np.NaN
+            return NAN
         return 0
 
     def has_neighbors(self) -> bool:
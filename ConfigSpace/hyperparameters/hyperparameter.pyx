@@ -46,13 +46,18 @@ cdef class Hyperparameter(object):
     def rvs(
         self,
         size: Optional[int] = None,
-        random_state: Optional[Union[int, np.random, np.random.RandomState]] = None
+        random_state: Optional[
+            Union[int, np.random, np.random.RandomState, np.random.Generator]
+        ] = None
     ) -> Union[float, np.ndarray]:
         """
         scipy compatibility wrapper for ``_sample``,
         allowing the hyperparameter to be used in sklearn API
         hyperparameter searchers, eg. GridSearchCV.
 
+        A ``np.random.Generator`` is used as is, which draws faster than the
+        legacy ``np.random.RandomState`` for large ``size``.
+
         """
 
         # copy-pasted from scikit-learn utils/validation.py
@@ -15,6 +15,5 @@ from .numerical cimport NumericalHyperparameter
 
 
 cdef class IntegerHyperparameter(NumericalHyperparameter):
-    cdef ufhp
     cpdef long long _transform_scalar(self, double scalar)
     cpdef np.ndarray _transform_vector(self, np.ndarray vector)
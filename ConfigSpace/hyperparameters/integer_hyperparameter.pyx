@@ -63,7 +63,7 @@ cdef class IntegerHyperparameter(NumericalHyperparameter):
         """
         if vector.ndim != 1:
             raise ValueError("Method pdf expects a one-dimensional numpy array")
-        is_integer = (np.round(vector) == vector).astype(int)
+        is_integer = np.rint(vector) == vector
         vector = self._inverse_transform(vector)
         return self._pdf(vector) * is_integer
 
@@ -17,3 +17,7 @@ from .float_hyperparameter cimport FloatHyperparameter
 cdef class NormalFloatHyperparameter(FloatHyperparameter):
     cdef public mu
     cdef public sigma
+    # Typed copies of ``log`` and ``q is not None`` set once in ``__init__``, the scalar
+    # transformations branch on these instead of the python attributes
+    cdef bint _is_log
+    cdef bint _is_quantized
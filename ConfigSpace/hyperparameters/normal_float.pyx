@@ -1,15 +1,17 @@
-import io
-import math
 from typing import Any, Dict, List, Optional, Union
 
 from scipy.stats import truncnorm, norm
 import numpy as np
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN, exp, rint
 
 from ConfigSpace.hyperparameters.uniform_float cimport UniformFloatHyperparameter
 from ConfigSpace.hyperparameters.normal_integer cimport NormalIntegerHyperparameter
 
+# Types of the values which are legal numbers, built once instead of on every call
+_NUMBER_TYPES = (float, int, np.number)
+
 
 cdef class NormalFloatHyperparameter(FloatHyperparameter):
 
@@ -58,6 +60,8 @@ cdef class NormalFloatHyperparameter(FloatHyperparameter):
         self.sigma = float(sigma)
         self.q = float(q) if q is not None else None
         self.log = bool(log)
+        self._is_log = self.log
+        self._is_quantized = self.q is not None
         self.default_value = self.check_default(default_value)
         self.normalized_default_value = self._inverse_transform(self.default_value)
 
@@ -106,19 +110,21 @@ cdef class NormalFloatHyperparameter(FloatHyperparameter):
                     )
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-
         if self.lower is None or self.upper is None:
-            repr_str.write("%s, Type: NormalFloat, Mu: %s Sigma: %s, Default: %s" % (self.name, repr(self.mu), repr(self.sigma), repr(self.default_value)))
+            repr_str = (
+                f"{self.name}, Type: NormalFloat, Mu: {self.mu!r} Sigma: {self.sigma!r}, "
+                f"Default: {self.default_value!r}"
+            )
         else:
-            repr_str.write("%s, Type: NormalFloat, Mu: %s Sigma: %s, Range: [%s, %s], Default: %s" % (self.name, repr(self.mu), repr(self.sigma), repr(self.lower), repr(self.upper), repr(self.default_value)))
-
+            repr_str = (
+                f"{self.name}, Type: NormalFloat, Mu: {self.mu!r} Sigma: {self.sigma!r}, "
+                f"Range: [{self.lower!r}, {self.upper!r}], Default: {self.default_value!r}"
+            )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % str(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q}"
+        return repr_str
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -207,12 +213,13 @@ cdef class NormalFloatHyperparameter(FloatHyperparameter):
                                            q=q_int, log=self.log)
 
     def is_legal(self, value: Union[float]) -> bool:
-        return (isinstance(value, (float, int, np.number)))  and \
+        return isinstance(value, _NUMBER_TYPES) and \
                (self.lower is None or value >= self.lower) and \
                (self.upper is None or value <= self.upper)
 
     cpdef bint is_legal_vector(self, DTYPE_t value):
-        return isinstance(value, float) or isinstance(value, int)
+        # Any double is a legal vector value of an unbounded normal distribution
+        return True
 
     def _sample(self, rs: np.random.RandomState, size: Optional[int] = None
                 ) -> Union[np.ndarray, float]:
@@ -237,21 +244,24 @@ cdef class NormalFloatHyperparameter(FloatHyperparameter):
         if self.log:
             vector = np.exp(vector)
         if self.q is not None:
-            vector = np.rint(vector / self.q) * self.q
+            # Quantize in place if np.exp already allocated a new array
+            vector = np.divide(vector, self.q, out=vector if self.log else None)
+            np.rint(vector, out=vector)
+            np.multiply(vector, self.q, out=vector)
         return vector
 
     cpdef double _transform_scalar(self, double scalar):
         if scalar != scalar:
             raise ValueError("Number %s is NaN" % scalar)
-        if self.log:
-            scalar = math.exp(scalar)
-        if self.q is not None:
-            scalar = np.round(scalar / self.q) * self.q
+        if self._is_log:
+            scalar = exp(scalar)
+        if self._is_quantized:
+            scalar = rint(scalar / <double>self.q) * <double>self.q
         return scalar
 
     def _inverse_transform(self, vector: Optional[np.ndarray]) -> Union[float, np.ndarray]:
         if vector is None:
-            return np.NaN
+            return NAN
 
         if self.log:
             vector = np.log(vector)
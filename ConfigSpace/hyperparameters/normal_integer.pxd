@@ -12,10 +12,11 @@ DTYPE = float
 ctypedef np.float_t DTYPE_t
 
 from .integer_hyperparameter cimport IntegerHyperparameter
+from .normal_float cimport NormalFloatHyperparameter
 
 
 cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
     cdef public mu
     cdef public sigma
-    cdef public nfhp
+    cdef public NormalFloatHyperparameter nfhp
     cdef public normalization_constant
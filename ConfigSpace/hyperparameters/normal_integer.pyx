@@ -1,13 +1,13 @@
 from itertools import count
-import io
 from more_itertools import roundrobin
 from typing import List, Any, Dict, Union, Optional
 import warnings
 
-from scipy.stats import truncnorm, norm
+from scipy.stats import truncnorm
 import numpy as np
 cimport numpy as np
 np.import_array()
+from libc.math cimport rint
 
 from ConfigSpace.functional import center_range, arange_chunked
 from ConfigSpace.hyperparameters.uniform_integer cimport UniformIntegerHyperparameter
@@ -22,6 +22,9 @@ from ConfigSpace.hyperparameters.normal_float cimport NormalFloatHyperparameter
 # be noticable.
 ARANGE_CHUNKSIZE = 10_000_000
 
+# Types of the values which are legal integers, built once instead of on every call
+_INT_TYPES = (int, np.integer)
+
 
 cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
 
@@ -123,19 +126,21 @@ cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
             self.normalization_constant = self._compute_normalization()
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-
         if self.lower is None or self.upper is None:
-            repr_str.write("%s, Type: NormalInteger, Mu: %s Sigma: %s, Default: %s" % (self.name, repr(self.mu), repr(self.sigma), repr(self.default_value)))
+            repr_str = (
+                f"{self.name}, Type: NormalInteger, Mu: {self.mu!r} Sigma: {self.sigma!r}, "
+                f"Default: {self.default_value!r}"
+            )
         else:
-            repr_str.write("%s, Type: NormalInteger, Mu: %s Sigma: %s, Range: [%s, %s], Default: %s" % (self.name, repr(self.mu), repr(self.sigma), repr(self.lower), repr(self.upper), repr(self.default_value)))
-
+            repr_str = (
+                f"{self.name}, Type: NormalInteger, Mu: {self.mu!r} Sigma: {self.sigma!r}, "
+                f"Range: [{self.lower!r}, {self.upper!r}], Default: {self.default_value!r}"
+            )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % str(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q}"
+        return repr_str
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -195,12 +200,13 @@ cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
                                             q=self.q, log=self.log, meta=self.meta)
 
     def is_legal(self, value: int) -> bool:
-        return (isinstance(value, (int, np.integer))) and \
+        return isinstance(value, _INT_TYPES) and \
                (self.lower is None or value >= self.lower) and \
                (self.upper is None or value <= self.upper)
 
     cpdef bint is_legal_vector(self, DTYPE_t value):
-        return isinstance(value, float) or isinstance(value, int)
+        # Any double is a legal vector value of an unbounded normal distribution
+        return True
 
     def check_default(self, default_value: int) -> int:
         if default_value is None:
@@ -225,12 +231,14 @@ cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
         return value
 
     cpdef np.ndarray _transform_vector(self, np.ndarray vector):
-        vector = self.nfhp._transform_vector(vector)
-        return np.rint(vector)
+        cdef np.ndarray transformed = self.nfhp._transform_vector(vector)
+        if transformed is vector:
+            return np.rint(vector)
+        # The float hyperparameter already returned a new array, round it in place
+        return np.rint(transformed, out=transformed)
 
     cpdef long long _transform_scalar(self, double scalar):
-        scalar = self.nfhp._transform_scalar(scalar)
-        return int(np.round(scalar))
+        return <long long>rint(self.nfhp._transform_scalar(scalar))
 
     def _inverse_transform(self, vector: Union[np.ndarray, float, int]
                            ) -> Union[np.ndarray, float]:
@@ -254,27 +262,22 @@ cdef class NormalIntegerHyperparameter(IntegerHyperparameter):
         neighbors: set[int] = set()
         center = self._transform(value)
 
+        # Draw the samples without building a frozen scipy distribution first, which
+        # costs more than the sampling itself
         if not bounded:
-            float_indices = norm.rvs(
-                loc=mu,
-                scale=sigma,
-                size=number,
-                random_state=rs,
-            )
+            float_indices = rs.normal(mu, sigma, size=number)
         else:
-            dist = truncnorm(
-                a = (self.lower - mu) / sigma,
-                b = (self.upper - mu) / sigma,
+            float_indices = truncnorm.rvs(
+                (self.lower - mu) / sigma,
+                (self.upper - mu) / sigma,
                 loc=center,
                 scale=sigma,
-            )
-
-            float_indices = dist.rvs(
                 size=number,
                 random_state=rs,
             )
 
-        possible_neighbors = self._transform_vector(float_indices).astype(np.longlong)
+        # As python ints, which are cheaper to hash and compare than numpy scalars
+        possible_neighbors = self._transform_vector(float_indices).astype(np.longlong).tolist()
 
         for possible_neighbor in possible_neighbors:
             # If we already happen to have this neighbor, pick the closest
@@ -1,11 +1,11 @@
 from collections import OrderedDict
 import copy
-import io
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN, floor, isfinite
 
 # We now need to fix a datatype for our arrays. I've used the variable
 # DTYPE for this, which is assigned to the usual NumPy runtime
@@ -22,8 +22,11 @@ from ConfigSpace.hyperparameters.hyperparameter cimport Hyperparameter
 cdef class OrdinalHyperparameter(Hyperparameter):
     cdef public tuple sequence
     cdef public int num_elements
-    cdef sequence_vector
     cdef value_dict
+    cdef dict index_dict
+    cdef np.ndarray _sequence_array
+    cdef Py_hash_t _sequence_hash
+    cdef dict _neighbor_cache
 
     def __init__(
         self,
@@ -69,34 +72,36 @@ cdef class OrdinalHyperparameter(Hyperparameter):
             raise ValueError(
                 "Ordinal Hyperparameter Sequence %s contain duplicate values." % sequence)
         self.sequence = tuple(sequence)
+        # Hashing the sequence is linear in its length, it never changes so this is
+        # only done once
+        self._sequence_hash = hash(self.sequence)
         self.num_elements = len(sequence)
-        self.sequence_vector = list(range(self.num_elements))
-        self.default_value = self.check_default(default_value)
-        self.normalized_default_value = self._inverse_transform(self.default_value)
         self.value_dict = OrderedDict()  # type: OrderedDict[Union[int, float, str], int]
         counter = 0
         for element in self.sequence:
             self.value_dict[element] = counter
             counter += 1
+        self.index_dict = {order: element for element, order in self.value_dict.items()}
+        # Element-wise so that values which are sequences themselves stay single objects
+        self._sequence_array = np.empty(self.num_elements, dtype=object)
+        for order, element in enumerate(self.sequence):
+            self._sequence_array[order] = element
+        self.default_value = self.check_default(default_value)
+        self.normalized_default_value = self._inverse_transform(self.default_value)
+        self._neighbor_cache = {}
 
     def __hash__(self):
-        return hash((self.name, self.sequence))
+        return hash((self.name, self._sequence_hash))
 
     def __repr__(self) -> str:
         """
         write out the parameter definition
         """
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: Ordinal, Sequence: {" % (self.name))
-        for idx, seq in enumerate(self.sequence):
-            repr_str.write(str(seq))
-            if idx < len(self.sequence) - 1:
-                repr_str.write(", ")
-        repr_str.write("}")
-        repr_str.write(", Default: ")
-        repr_str.write(str(self.default_value))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+        sequence = ", ".join(map(str, self.sequence))
+        return (
+            f"{self.name}, Type: Ordinal, Sequence: {{{sequence}}}, "
+            f"Default: {self.default_value!s}"
+        )
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -120,6 +125,14 @@ cdef class OrdinalHyperparameter(Hyperparameter):
             self.default_value == other.default_value
         )
 
+    def __reduce__(self):
+        # Pickled by the constructor arguments so that the hash of the sequence, which
+        # differs between processes, is computed again when unpickling
+        return (
+            OrdinalHyperparameter,
+            (self.name, self.sequence, self.default_value, self.meta),
+        )
+
     def __copy__(self):
         return OrdinalHyperparameter(
                 name=self.name,
@@ -129,11 +142,13 @@ cdef class OrdinalHyperparameter(Hyperparameter):
             )
 
     cpdef int compare(self, value: Union[int, float, str], value2: Union[int, float, str]):
-        if self.value_dict[value] < self.value_dict[value2]:
+        cdef int order = self.value_dict[value]
+        cdef int order2 = self.value_dict[value2]
+        if order < order2:
             return -1
-        elif self.value_dict[value] > self.value_dict[value2]:
+        elif order > order2:
             return 1
-        elif self.value_dict[value] == self.value_dict[value2]:
+        else:
             return 0
 
     cpdef int compare_vector(self, DTYPE_t value, DTYPE_t value2):
@@ -148,10 +163,14 @@ cdef class OrdinalHyperparameter(Hyperparameter):
         """
         check if a certain value is represented in the sequence
         """
-        return value in self.sequence
+        try:
+            return value in self.value_dict
+        except TypeError:
+            # Unhashable values such as single element arrays are compared one by one
+            return value in self.sequence
 
     cpdef bint is_legal_vector(self, DTYPE_t value):
-        return value in self.sequence_vector
+        return 0 <= value < self.num_elements and value % 1 == 0
 
     def check_default(self, default_value: Optional[Union[int, float, str]]
                       ) -> Union[int, float, str]:
@@ -171,18 +190,20 @@ cdef class OrdinalHyperparameter(Hyperparameter):
         if np.isnan(vector).any():
             raise ValueError('Vector %s contains NaN\'s' % vector)
 
-        if np.equal(np.mod(vector, 1), 0):
-            return self.sequence[vector.astype(int)]
+        if np.equal(np.mod(vector, 1), 0).all():
+            return self._sequence_array[vector.astype(np.intp)]
 
         raise ValueError("Can only index the choices of the ordinal "
-                         "hyperparameter %s with an integer, but provided "
-                         "the following float: %f" % (self, vector))
+                         "hyperparameter %s with integers, but provided "
+                         "the following floats: %s" % (self, vector))
 
     def _transform_scalar(self, scalar: Union[float, int]) -> Union[float, int, str]:
-        if scalar != scalar:
+        # Work on a C double, which avoids boxed float arithmetic in the checks below
+        cdef double value = scalar
+        if value != value:
             raise ValueError("Number %s is NaN" % scalar)
 
-        if scalar % 1 == 0:
+        if isfinite(value) and floor(value) == value:
             return self.sequence[int(scalar)]
 
         raise ValueError("Can only index the choices of the ordinal "
@@ -192,7 +213,7 @@ cdef class OrdinalHyperparameter(Hyperparameter):
     def _transform(self, vector: Union[np.ndarray, float, int]
                    ) -> Optional[Union[np.ndarray, float, int]]:
         try:
-            if isinstance(vector, np.ndarray):
+            if isinstance(vector, np.ndarray) and vector.ndim >= 1:
                 return self._transform_vector(vector)
             return self._transform_scalar(vector)
         except ValueError:
@@ -201,8 +222,14 @@ cdef class OrdinalHyperparameter(Hyperparameter):
     def _inverse_transform(self, vector: Optional[Union[np.ndarray, List, int, str, float]]
                            ) -> Union[float, List[int], List[str], List[float]]:
         if vector is None:
-            return np.NaN
-        return self.sequence.index(vector)
+            return NAN
+        try:
+            return self.value_dict[vector]
+        except KeyError:
+            raise ValueError("%s is not in the sequence of %s" % (repr(vector), self.name)) from None
+        except TypeError:
+            # Unhashable values such as single element arrays are compared one by one
+            return self.sequence.index(vector)
 
     def get_seq_order(self) -> np.ndarray:
         """
@@ -221,23 +248,23 @@ cdef class OrdinalHyperparameter(Hyperparameter):
         """
         return the sequence value of a given order/position
         """
-        return list(self.value_dict.keys())[list(self.value_dict.values()).index(idx)]
+        try:
+            return self.index_dict[idx]
+        except KeyError:
+            raise ValueError("%s is not a position in the sequence of %s" % (idx, self.name))
 
     def check_order(self, val1: Union[int, str, float], val2: Union[int, str, float]) -> bool:
         """
         check whether value1 is smaller than value2.
         """
-        idx1 = self.get_order(val1)
-        idx2 = self.get_order(val2)
-        if idx1 < idx2:
-            return True
-        else:
-            return False
+        return self.value_dict[val1] < self.value_dict[val2]
 
     def _sample(self, rs: np.random.RandomState, size: Optional[int] = None) -> int:
         """
         return a random sample from our sequence as order/position index
         """
+        if isinstance(rs, np.random.Generator):
+            return rs.integers(0, self.num_elements, size=size)
         return rs.randint(0, self.num_elements, size=size)
 
     def has_neighbors(self) -> bool:
@@ -266,35 +293,33 @@ cdef class OrdinalHyperparameter(Hyperparameter):
         Return the neighbors of a given value.
         Value must be in vector form. Ordinal name will not work.
         """
+        cdef Py_ssize_t index
+        # A value has at most two neighbors, its predecessor and its successor in the sequence
         neighbors = []
         if transform:
-            if self.get_num_neighbors(value) < len(self.sequence):
-                index = self.get_order(value)
-                neighbor_idx1 = index - 1
-                neighbor_idx2 = index + 1
-                seq = self.get_seq_order()
-
-                if neighbor_idx1 >= seq[0]:
-                    candidate1 = self.get_value(neighbor_idx1)
-                    if self.check_order(candidate1, value):
-                        neighbors.append(candidate1)
-                if neighbor_idx2 < self.num_elements:
-                    candidate2 = self.get_value(neighbor_idx2)
-                    if self.check_order(value, candidate2):
-                        neighbors.append(candidate2)
-
-        else:
-            if self.get_num_neighbors(self.get_value(value)) < len(self.sequence):
-                index = value
-                neighbor_idx1 = index - 1
-                neighbor_idx2 = index + 1
-                seq = self.get_seq_order()
-
-                if neighbor_idx1 < index and neighbor_idx1 >= seq[0]:
-                    neighbors.append(neighbor_idx1)
-                if neighbor_idx2 > index and neighbor_idx2 < self.num_elements:
-                    neighbors.append(neighbor_idx2)
-
+            index = self.value_dict[value]
+            if index > 0:
+                neighbors.append(self.sequence[index - 1])
+            if index < self.num_elements - 1:
+                neighbors.append(self.sequence[index + 1])
+            return neighbors
+
+        # Vector neighbors are memoized per value, ``number`` does not change them. The type
+        # is part of the key since 1 and 1.0 hash equally but yield neighbors of different
+        # types. A copy is returned because callers shuffle and pop the list.
+        key = (value, type(value))
+        cached = self._neighbor_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Raises a ValueError if the value is not a position in the sequence
+        self.get_value(value)
+        if value - 1 >= 0:
+            neighbors.append(value - 1)
+        if value + 1 < self.num_elements:
+            neighbors.append(value + 1)
+
+        self._neighbor_cache[key] = tuple(neighbors)
         return neighbors
 
     def allow_greater_less_comparison(self) -> bool:
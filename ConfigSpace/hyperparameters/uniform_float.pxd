@@ -15,4 +15,8 @@ from ConfigSpace.hyperparameters.float_hyperparameter cimport FloatHyperparamete
 
 
 cdef class UniformFloatHyperparameter(FloatHyperparameter):
-    pass
+    # Typed copies of ``log`` and ``q is not None`` set once in ``__init__``, the scalar
+    # transformations branch on these instead of the python attributes
+    cdef bint _is_log
+    cdef bint _is_quantized
+    cdef double _scale
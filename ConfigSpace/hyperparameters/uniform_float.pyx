@@ -1,13 +1,17 @@
-import io
-import math
 from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
+cimport cython
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN, exp, rint
 
 from ConfigSpace.hyperparameters.uniform_integer cimport UniformIntegerHyperparameter
 
+# Types of the values which are transformed as a single number, built once instead
+# of on every call
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
 
 cdef class UniformFloatHyperparameter(FloatHyperparameter):
     def __init__(self, name: str, lower: Union[int, float], upper: Union[int, float],
@@ -87,28 +91,50 @@ cdef class UniformFloatHyperparameter(FloatHyperparameter):
                     % (self.upper, self.lower, self.q)
                 )
 
+        self._is_log = self.log
+        self._is_quantized = self.q is not None
+        self._scale = self._upper - self._lower
         self.normalized_default_value = self._inverse_transform(self.default_value)
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: UniformFloat, Range: [%s, %s], Default: %s" %
-                       (self.name, repr(self.lower), repr(self.upper),
-                        repr(self.default_value)))
+        repr_str = (
+            f"{self.name}, Type: UniformFloat, Range: [{self.lower!r}, {self.upper!r}], "
+            f"Default: {self.default_value!r}"
+        )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % str(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q}"
+        return repr_str
 
     def is_legal(self, value: Union[float]) -> bool:
-        if not (isinstance(value, float) or isinstance(value, int)):
+        if not isinstance(value, (float, int)):
             return False
         elif self.upper >= value >= self.lower:
             return True
         else:
             return False
 
+    def is_legal_array(self, value: np.ndarray) -> np.ndarray:
+        """
+        Check a whole array of values at once, with a single comparison per bound.
+
+        Arrays which are not of a numeric dtype are illegal everywhere.
+
+        Parameters
+        ----------
+        value : np.ndarray
+            Values in the original space of the hyperparameter
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of the shape of ``value``, True where the value is legal
+        """
+        if value.dtype.kind not in "fiu":
+            return np.zeros_like(value, dtype=bool)
+        return (value >= self.lower) & (value <= self.upper)
+
     cpdef bint is_legal_vector(self, DTYPE_t value):
         if 1.0 >= value >= 0.0:
             return True
@@ -144,35 +170,81 @@ cdef class UniformFloatHyperparameter(FloatHyperparameter):
     def _sample(self, rs: np.random, size: Optional[int] = None) -> Union[float, np.ndarray]:
         return rs.uniform(size=size)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     cpdef np.ndarray _transform_vector(self, np.ndarray vector):
-        if np.isnan(vector).any():
-            raise ValueError('Vector %s contains NaN\'s' % vector)
-        vector = vector * (self._upper - self._lower) + self._lower
-        if self.log:
-            vector = np.exp(vector)
-        if self.q is not None:
-            vector = np.rint((vector - self.lower) / self.q) * self.q + self.lower
-            vector = np.minimum(vector, self.upper)
-            vector = np.maximum(vector, self.lower)
-        return np.maximum(self.lower, np.minimum(self.upper, vector))
+        cdef np.ndarray result = np.array(vector, dtype=np.float64, order="C")
+        cdef double[::1] values = result.reshape(-1)
+        cdef double lower = self.lower
+        cdef double upper = self.upper
+        cdef double scale = self._scale
+        cdef double offset = self._lower
+        cdef bint is_log = self._is_log
+        cdef bint is_quantized = self._is_quantized
+        cdef double q = self.q if is_quantized else 0.0
+        cdef double value
+        cdef Py_ssize_t i
+        # A single pass over a private copy doing exactly what _transform_scalar does
+        for i in range(values.shape[0]):
+            value = values[i]
+            if value != value:
+                raise ValueError('Vector %s contains NaN\'s' % vector)
+            value = value * scale + offset
+            if is_log:
+                value = exp(value)
+            if is_quantized:
+                value = rint((value - lower) / q) * q + lower
+            if not value > lower:
+                value = lower
+            if not value < upper:
+                value = upper
+            values[i] = value
+        return result
 
     cpdef double _transform_scalar(self, double scalar):
+        cdef double lower = self.lower
+        cdef double upper = self.upper
+        cdef double q
         if scalar != scalar:
             raise ValueError("Number %s is NaN" % scalar)
-        scalar = scalar * (self._upper - self._lower) + self._lower
-        if self.log:
-            scalar = math.exp(scalar)
-        if self.q is not None:
-            scalar = np.round((scalar - self.lower) / self.q) * self.q + self.lower
-            scalar = min(scalar, self.upper)
-            scalar = max(scalar, self.lower)
-        scalar = min(self.upper, max(self.lower, scalar))
+        scalar = scalar * self._scale + <double>self._lower
+        if self._is_log:
+            scalar = exp(scalar)
+        if self._is_quantized:
+            q = self.q
+            scalar = rint((scalar - lower) / q) * q + lower
+        # Same result as ``min(upper, max(lower, scalar))``
+        if not scalar > lower:
+            scalar = lower
+        if not scalar < upper:
+            scalar = upper
         return scalar
 
     def _inverse_transform(self, vector: Union[np.ndarray, None]
                            ) -> Union[np.ndarray, float, int]:
+        cdef double normalized
         if vector is None:
-            return np.NaN
+            return NAN
+        if isinstance(vector, np.ndarray):
+            # Only the first operation allocates, all others work in place on its result
+            if self.log:
+                vector = np.log(vector)
+                np.subtract(vector, self._lower, out=vector)
+            else:
+                vector = np.subtract(vector, self._lower)
+            np.divide(vector, self._upper - self._lower, out=vector)
+            np.minimum(vector, 1.0, out=vector)
+            np.maximum(vector, 0.0, out=vector)
+            return vector
+        if isinstance(vector, _NUMBER_TYPES):
+            if self._is_log:
+                vector = np.log(vector)
+            normalized = (<double>vector - <double>self._lower) / self._scale
+            if normalized > 1.0:
+                normalized = 1.0
+            if normalized < 0.0:
+                normalized = 0.0
+            return normalized
         if self.log:
             vector = np.log(vector)
         vector = (vector - self._lower) / (self._upper - self._lower)
@@ -190,13 +262,12 @@ cdef class UniformFloatHyperparameter(FloatHyperparameter):
     ) -> List[float]:
         neighbors = []  # type: List[float]
         while len(neighbors) < number:
-            neighbor = rs.normal(value, std)  # type: float
-            if neighbor < 0 or neighbor > 1:
-                continue
-            if transform:
-                neighbors.append(self._transform(neighbor))
-            else:
-                neighbors.append(neighbor)
+            # Draw exactly as many values as are still missing, this gives the same
+            # neighbors and leaves ``rs`` in the same state as drawing them one by one
+            candidates = rs.normal(value, std, size=number - len(neighbors))
+            neighbors.extend(candidates[(candidates >= 0) & (candidates <= 1)].tolist())
+        if transform:
+            return [self._transform_scalar(neighbor) for neighbor in neighbors]
         return neighbors
 
     def _pdf(self, vector: np.ndarray) -> np.ndarray:
@@ -15,4 +15,8 @@ from ConfigSpace.hyperparameters.integer_hyperparameter cimport IntegerHyperpara
 
 
 cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
-    pass
+    # Typed copies of ``log`` and ``q is not None`` set once in ``__init__``, the scalar
+    # transformations branch on these instead of the python attributes
+    cdef bint _is_log
+    cdef bint _is_quantized
+    cdef double _scale
@@ -1,13 +1,18 @@
-import io
 from typing import Dict, List, Optional, Union
 import warnings
 
 import numpy as np
+cimport cython
 cimport numpy as np
 np.import_array()
+from libc.math cimport NAN, exp, log, rint
 
 from ConfigSpace.functional import center_range
-from ConfigSpace.hyperparameters.uniform_float cimport UniformFloatHyperparameter
+
+# Types of the values which are transformed as a single number and of the values
+# which are legal integers, built once instead of on every call
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+_INT_TYPES = (int, np.int32, np.int64)
 
 
 cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
@@ -79,65 +84,160 @@ cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
 
         self.default_value = self.check_default(default_value)
 
-        self.ufhp = UniformFloatHyperparameter(self.name,
-                                               self.lower - 0.49999,
-                                               self.upper + 0.49999,
-                                               log=self.log,
-                                               default_value=self.default_value)
+        # Bounds of the unit-cube mapping. Each integer covers (almost) the same share
+        # of the unit cube, including the two at the bounds.
+        if self.log:
+            self._lower = np.log(self.lower - 0.49999)
+            self._upper = np.log(self.upper + 0.49999)
+        else:
+            self._lower = self.lower - 0.49999
+            self._upper = self.upper + 0.49999
 
+        self._is_log = self.log
+        self._is_quantized = self.q is not None
+        self._scale = self._upper - self._lower
         self.normalized_default_value = self._inverse_transform(self.default_value)
 
     def __repr__(self) -> str:
-        repr_str = io.StringIO()
-        repr_str.write("%s, Type: UniformInteger, Range: [%s, %s], Default: %s"
-                       % (self.name, repr(self.lower),
-                          repr(self.upper), repr(self.default_value)))
+        repr_str = (
+            f"{self.name}, Type: UniformInteger, Range: [{self.lower!r}, {self.upper!r}], "
+            f"Default: {self.default_value!r}"
+        )
         if self.log:
-            repr_str.write(", on log-scale")
+            repr_str += ", on log-scale"
         if self.q is not None:
-            repr_str.write(", Q: %s" % repr(self.q))
-        repr_str.seek(0)
-        return repr_str.getvalue()
+            repr_str += f", Q: {self.q!r}"
+        return repr_str
 
     def _sample(self, rs: np.random.RandomState, size: Optional[int] = None
                 ) -> Union[np.ndarray, float]:
-        value = self.ufhp._sample(rs, size=size)
+        value = rs.uniform(size=size)
         # Map all floats which belong to the same integer value to the same
         # float value by first transforming it to an integer and then
         # transforming it back to a float between zero and one
-        value = self._transform(value)
-        value = self._inverse_transform(value)
+        if size is None:
+            return self._inverse_transform(self._transform_scalar(value))
+        value = self._transform_vector(value)
+        # _transform_vector returned a fresh float array of integer values, normalize it in place
+        if self.log:
+            np.log(value, out=value)
+        np.subtract(value, self._lower, out=value)
+        np.divide(value, self._upper - self._lower, out=value)
+        np.minimum(value, 1.0, out=value)
+        np.maximum(value, 0.0, out=value)
         return value
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     cpdef np.ndarray _transform_vector(self, np.ndarray vector):
-        vector = self.ufhp._transform_vector(vector)
-        if self.q is not None:
-            vector = np.rint((vector - self.lower) / self.q) * self.q + self.lower
-            vector = np.minimum(vector, self.upper)
-            vector = np.maximum(vector, self.lower)
-
-        return np.rint(vector)
+        cdef np.ndarray result = np.array(vector, dtype=np.float64, order="C")
+        cdef double[::1] values = result.reshape(-1)
+        cdef double lower = self.lower
+        cdef double upper = self.upper
+        cdef double scale = self._scale
+        cdef double offset = self._lower
+        cdef bint is_log = self._is_log
+        cdef bint is_quantized = self._is_quantized
+        cdef double q = self.q if is_quantized else 0.0
+        cdef double value
+        cdef Py_ssize_t i
+        # A single pass over a private float64 copy doing exactly what _transform_scalar does
+        for i in range(values.shape[0]):
+            value = values[i]
+            if value != value:
+                raise ValueError('Vector %s contains NaN\'s' % vector)
+            value = value * scale + offset
+            if is_log:
+                value = exp(value)
+            if is_quantized:
+                value = rint((value - lower) / q) * q + lower
+            if value < lower:
+                value = lower
+            if value > upper:
+                value = upper
+            values[i] = rint(value)
+        return result
 
     cpdef long long _transform_scalar(self, double scalar):
-        scalar = self.ufhp._transform_scalar(scalar)
-        if self.q is not None:
-            scalar = np.round((scalar - self.lower) / self.q) * self.q + self.lower
-            scalar = min(scalar, self.upper)
-            scalar = max(scalar, self.lower)
-        return int(np.round(scalar))
+        cdef double lower = self.lower
+        cdef double upper = self.upper
+        cdef double q
+        if scalar != scalar:
+            raise ValueError("Number %s is NaN" % scalar)
+        scalar = scalar * self._scale + <double>self._lower
+        if self._is_log:
+            scalar = exp(scalar)
+        # The float range only exceeds [lower, upper] by less than half on each side, so
+        # clipping to the integer bounds directly gives the same integer after rounding
+        if self._is_quantized:
+            q = self.q
+            scalar = rint((scalar - lower) / q) * q + lower
+        if scalar < lower:
+            scalar = lower
+        if scalar > upper:
+            scalar = upper
+        return <long long>rint(scalar)
 
     def _inverse_transform(self, vector: Union[np.ndarray, float, int]
                            ) -> Union[np.ndarray, float, int]:
-        return self.ufhp._inverse_transform(vector)
+        cdef double normalized
+        if vector is None:
+            return NAN
+        if isinstance(vector, np.ndarray):
+            # Only the first operation allocates, all others work in place on its result
+            if self.log:
+                vector = np.log(vector)
+                np.subtract(vector, self._lower, out=vector)
+            else:
+                vector = np.subtract(vector, self._lower)
+            np.divide(vector, self._upper - self._lower, out=vector)
+            np.minimum(vector, 1.0, out=vector)
+            np.maximum(vector, 0.0, out=vector)
+            return vector
+        if isinstance(vector, _NUMBER_TYPES):
+            if self._is_log:
+                vector = np.log(vector)
+            normalized = (<double>vector - <double>self._lower) / self._scale
+            if normalized > 1.0:
+                normalized = 1.0
+            if normalized < 0.0:
+                normalized = 0.0
+            return normalized
+        if self.log:
+            vector = np.log(vector)
+        vector = (vector - self._lower) / (self._upper - self._lower)
+        vector = np.minimum(1.0, vector)
+        vector = np.maximum(0.0, vector)
+        return vector
 
     def is_legal(self, value: int) -> bool:
-        if not (isinstance(value, (int, np.int32, np.int64))):
+        if not isinstance(value, _INT_TYPES):
             return False
         elif self.upper >= value >= self.lower:
             return True
         else:
             return False
 
+    def is_legal_array(self, value: np.ndarray) -> np.ndarray:
+        """
+        Check a whole array of values at once, with a single comparison per bound.
+
+        Arrays which are not of an integer dtype are illegal everywhere.
+
+        Parameters
+        ----------
+        value : np.ndarray
+            Values in the original space of the hyperparameter
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of the shape of ``value``, True where the value is legal
+        """
+        if value.dtype.kind not in "iu":
+            return np.zeros_like(value, dtype=bool)
+        return (value >= self.lower) & (value <= self.upper)
+
     cpdef bint is_legal_vector(self, DTYPE_t value):
         if 1.0 >= value >= 0.0:
             return True
@@ -147,7 +247,7 @@ cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
     def check_default(self, default_value: Union[int, float]) -> int:
         if default_value is None:
             if self.log:
-                default_value = np.exp((np.log(self.lower) + np.log(self.upper)) / 2.)
+                default_value = exp((log(self.lower) + log(self.upper)) / 2.)
             else:
                 default_value = (self.lower + self.upper) / 2.
         default_value = int(np.round(default_value, 0))
@@ -159,11 +259,11 @@ cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
 
     def has_neighbors(self) -> bool:
         if self.log:
-            upper = np.exp(self.ufhp._upper)
-            lower = np.exp(self.ufhp._lower)
+            upper = np.exp(self._upper)
+            lower = np.exp(self._lower)
         else:
-            upper = self.ufhp._upper
-            lower = self.ufhp._lower
+            upper = self._upper
+            lower = self._lower
 
         # If there is only one active value, this is not enough
         if upper - lower >= 1:
@@ -227,22 +327,23 @@ cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
             "Can only generate less than 1 million neighbors."
         )
         # Convert python values to cython ones
-        cdef long long center = self._transform(value)
+        cdef long long center = self._transform_scalar(value)
         cdef long long lower = self.lower
         cdef long long upper = self.upper
         cdef unsigned int n_requested = number
-        cdef unsigned long long n_neighbors = upper - lower - 1
         cdef long long stepsize = self.q if self.q is not None else 1
+        # Every value on the grid from lower to upper in steps of q, except the center
+        cdef unsigned long long n_neighbors = (upper - lower) // stepsize
 
         neighbors = []
 
         cdef long long v  # A value that's possible to return
-        if n_neighbors < n_requested:
+        if n_neighbors <= n_requested:
 
-            for v in range(lower, center):
+            for v in range(lower, center, stepsize):
                 neighbors.append(v)
 
-            for v in range(center + 1, upper + 1):
+            for v in range(center + stepsize, upper + 1, stepsize):
                 neighbors.append(v)
 
             if transform:
@@ -321,7 +422,11 @@ cdef class UniformIntegerHyperparameter(IntegerHyperparameter):
         np.ndarray(N, )
             Probability density values of the input vector
         """
-        return self.ufhp._pdf(vector)
+        # everything that comes into _pdf for a uniform variable should
+        # already be in [0, 1]-range, and if not, it's outside the upper
+        # or lower bound.
+        inside_range = ((0 <= vector) & (vector <= 1)).astype(int)
+        return inside_range / ((self.upper + 0.49999) - (self.lower - 0.49999))
 
     def get_max_density(self) -> float:
         lb = self.lower
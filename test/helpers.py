@@ -0,0 +1,42 @@
+"""Helpers shared between the test modules."""
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+from typing import Any
+
+import ConfigSpace
+
+
+def unpickle_from_other_process(code: str) -> Any:
+    """Run ``code`` in a new python process and unpickle the ``obj`` it defines.
+
+    Hashes of strings and bytes are salted per process. The other process uses a hash
+    seed different from this one, so that objects which carry a hash along when pickled
+    are noticed.
+
+    Parameters
+    ----------
+    code : str
+        Python source which assigns the object to pickle to ``obj``
+
+    Returns
+    -------
+    Any
+        The object unpickled in this process
+    """
+    script = f"import pickle, sys\n{code}\nsys.stdout.buffer.write(pickle.dumps(obj))\n"
+    hash_seed = "2" if os.environ.get("PYTHONHASHSEED") == "1" else "1"
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(ConfigSpace.__file__)), env.get("PYTHONPATH", "")],
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],  # noqa: S603
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return pickle.loads(output)  # noqa: S301
@@ -27,9 +27,13 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 
+import copy
 import json
+import pickle
 import unittest
+import weakref
 from collections import OrderedDict
+from collections.abc import Mapping
 from itertools import product
 
 import numpy as np
@@ -68,6 +72,7 @@ from ConfigSpace.hyperparameters import (
     OrdinalHyperparameter,
     UniformFloatHyperparameter,
 )
+from helpers import unpickle_from_other_process
 
 
 def byteify(input):
@@ -603,6 +608,19 @@ class TestConfigurationSpace(unittest.TestCase):
         # check backward compatibility with checking configurations instead of vectors
         cs.check_configuration(configuration)
 
+    def test_check_configuration_reports_inactive_hyperparameter(self):
+        cs = ConfigurationSpace()
+        parent = CategoricalHyperparameter("parent", ["a", "b"])
+        child = UniformFloatHyperparameter("child", 0, 1)
+        cs.add_hyperparameters([parent, child])
+        cs.add_condition(EqualsCondition(child, parent, "a"))
+
+        vector = np.array([1.0, 0.5])
+        with self.assertRaises(InactiveHyperparameterSetError) as e:
+            cs.check_configuration_vector_representation(vector)
+        assert e.exception.hyperparameter == child
+        assert e.exception.value == 0.5
+
     def test_check_forbidden_with_sampled_vector_configuration(self):
         cs = ConfigurationSpace()
         metric = CategoricalHyperparameter("metric", ["minkowski", "other"])
@@ -639,6 +657,13 @@ class TestConfigurationSpace(unittest.TestCase):
         cs1.add_hyperparameter(hp3)
         assert cs1 != cs2
 
+        # Spaces without the array caches, e.g. unpickled from older versions
+        cs3 = ConfigurationSpace({"a": [0, 1], "b": (0, 5)})
+        cs4 = ConfigurationSpace({"a": [0, 1], "b": (0, 5)})
+        del cs4.__dict__["_is_float"]
+        assert cs3 == cs4
+        assert cs4 == cs3
+
     def test_neq(self):
         cs1 = ConfigurationSpace()
         assert cs1 != "ConfigurationSpace"
@@ -1051,6 +1076,80 @@ class ConfigurationTest(unittest.TestCase):
         # a) that the vector representation of both are the same
         # b) that the dictionary representation of both are the same
         assert c1 == c2
+        assert hash(c1) == hash(c2)
+
+    def test_init_with_values_matches_inverse_transform(self):
+        cs = ConfigurationSpace()
+        cs.add_hyperparameters(
+            [
+                UniformFloatHyperparameter("a", 1e-5, 100, log=True),
+                UniformFloatHyperparameter("b", -3, 7, q=0.5),
+                UniformIntegerHyperparameter("c", 1, 1000, log=True),
+                UniformIntegerHyperparameter("d", -5, 50, q=5),
+                NormalFloatHyperparameter("e", mu=0, sigma=1),
+                CategoricalHyperparameter("f", ["x", "y", "z"]),
+            ],
+        )
+        for config in cs.sample_configuration(size=100):
+            from_values = Configuration(cs, values=dict(config))
+            expected = [cs[name]._inverse_transform(from_values[name]) for name in cs]
+            np.testing.assert_array_equal(from_values.get_array(), expected)
+
+    def test_eq_and_hash_after_values_round_trip(self):
+        # Vectors of sampled configurations are not canonical for log and quantized
+        # hyperparameters, rebuilding them from their values can give other vectors
+        cs = ConfigurationSpace(seed=1)
+        cs.add_hyperparameters(
+            [
+                UniformFloatHyperparameter("a", 1e-5, 100, log=True),
+                UniformFloatHyperparameter("b", -3, 7, q=0.5),
+                NormalFloatHyperparameter("c", mu=0, sigma=1, q=0.1),
+                UniformIntegerHyperparameter("d", 1, 1000, log=True),
+            ],
+        )
+        for config in cs.sample_configuration(size=50):
+            from_values = Configuration(cs, values=dict(config))
+            assert config == from_values
+            assert hash(config) == hash(from_values)
+
+    def test_getitem_matches_transform(self):
+        cs = ConfigurationSpace()
+        cs.add_hyperparameters(
+            [
+                UniformFloatHyperparameter("a", 1e-5, 100, log=True),
+                UniformFloatHyperparameter("b", -3, 7, q=0.5),
+                UniformIntegerHyperparameter("c", 1, 1000, log=True),
+                UniformIntegerHyperparameter("d", -5, 50, q=5),
+            ],
+        )
+        vectors = np.random.RandomState(1).uniform(size=(100, 4))
+        for config in Configuration.from_matrix(cs, vectors):
+            for name, value in config.items():
+                expected = cs[name]._transform(config.get_array()[cs._hyperparameter_idx[name]])
+                assert type(value) is type(expected)
+                assert value == expected
+
+    def test_init_with_vector(self):
+        vector = self.cs.sample_configuration().get_array().copy()
+        # Contiguous float64 vectors are taken as they are
+        assert Configuration(self.cs, vector=vector).get_array() is vector
+
+        # Other vectors are copied into a contiguous one
+        strided = np.repeat(vector, 2)[::2]
+        config = Configuration(self.cs, vector=strided)
+        assert config.get_array().flags.c_contiguous
+        np.testing.assert_array_equal(config.get_array(), vector)
+
+    def test_from_matrix(self):
+        configs = self.cs.sample_configuration(size=10)
+        matrix = np.array([config.get_array() for config in configs])
+
+        from_matrix = Configuration.from_matrix(self.cs, matrix)
+        assert from_matrix == configs
+        assert all(np.shares_memory(config.get_array(), matrix) for config in from_matrix)
+
+        with self.assertRaises(ValueError):
+            Configuration.from_matrix(self.cs, matrix[:, :2])
 
     def test_uniformfloat_transform(self):
         """This checks whether a value sampled through the configuration
@@ -1137,6 +1236,96 @@ class ConfigurationTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             conf["x2"]
 
+    def test_setitem_resets_cached_repr_and_hash(self):
+        config = Configuration(self.cs, values={"parent": 1, "child": 2, "friend": 3})
+        old_repr = repr(config)
+        old_hash = hash(config)
+
+        config["child"] = 5
+        assert "'child': 5" in repr(config)
+        assert repr(config) != old_repr
+        assert hash(config) != old_hash
+        assert hash(config) == hash(
+            Configuration(self.cs, values={"parent": 1, "child": 5, "friend": 3}),
+        )
+
+    def test_pickle_and_deepcopy_slotted(self):
+        config = Configuration(
+            self.cs,
+            values={"parent": 1, "child": 2, "friend": 3},
+            origin="test",
+            config_id=7,
+        )
+        assert not hasattr(config, "__dict__")
+        # Fill all caches
+        repr(config)
+        hash(config)
+        dict(config)
+
+        for copied in (copy.deepcopy(config), pickle.loads(pickle.dumps(config))):  # noqa: S301
+            assert not hasattr(copied, "__dict__")
+            assert copied.origin == "test"
+            assert copied.config_id == 7
+            assert copied.allow_inactive_with_values is False
+            assert copied.config_space == self.cs
+            assert copied.get_array() is not config.get_array()
+            np.testing.assert_array_equal(copied.get_array(), config.get_array())
+            # The caches are rebuilt instead of copied
+            assert copied._repr is None
+            assert copied._hash is None
+            assert copied._active is None
+            assert dict(copied) == dict(config)
+            assert repr(copied) == repr(config)
+            assert hash(copied) == hash(config)
+            assert copied == config
+            assert weakref.ref(copied)() is copied
+
+    def test_pickle_and_deepcopy_partially_cached(self):
+        cs = ConfigurationSpace({"a": (0.0, 1.0), "b": ["x", "y", "z"]}, seed=1)
+        config = cs.sample_configuration()
+        # Only the value of "a" is cached, "b" is marked as not computed yet
+        value_a = config["a"]
+        vector_b = config.get_array()[cs._hyperparameter_idx["b"]]
+        expected = {"a": value_a, "b": cs["b"]._transform(vector_b)}
+
+        unpickled = pickle.loads(pickle.dumps(config))  # noqa: S301
+        assert unpickled["b"] == expected["b"]
+        assert dict(unpickled) == expected
+        assert unpickled == config
+
+        copied = copy.deepcopy(config)
+        assert dict(copied) == expected
+        assert copied == config
+
+    def test_pickle(self):
+        config = Configuration(self.cs, values={"parent": 1, "child": 2, "friend": 3})
+        hash(config)
+        repr(config)
+        unpickled = pickle.loads(pickle.dumps(config))  # noqa: S301
+        assert unpickled == config
+        assert hash(unpickled) == hash(config)
+        assert unpickled.get_array() is not config.get_array()
+
+        # Only some of the values are cached
+        config = self.cs.get_default_configuration()
+        config["child"]
+        unpickled = pickle.loads(pickle.dumps(config))  # noqa: S301
+        assert dict(unpickled) == {"parent": 0, "child": 5, "friend": 2}
+        assert unpickled == config
+
+        # Hashes are salted per process, a configuration pickled in another process must
+        # not carry its hash along
+        unpickled = unpickle_from_other_process(
+            "from ConfigSpace import ConfigurationSpace\n"
+            "cs = ConfigurationSpace({'parent': [0, 1], 'child': (0, 10), 'friend': (0, 5)})\n"
+            "obj = cs.get_default_configuration()\n"
+            "obj['child']\n"
+            "hash(obj)\n",
+        )
+        fresh = unpickled.config_space.get_default_configuration()
+        assert unpickled == fresh
+        assert unpickled in {fresh}
+
     def test_setting_illegal_value(self):
         cs = ConfigurationSpace()
         cs.add_hyperparameter(UniformFloatHyperparameter("x", 0, 1))
@@ -1144,6 +1333,12 @@ class ConfigurationTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             Configuration(cs, values=configuration)
 
+        # Arrays are not legal values, whatever their content
+        cs.add_hyperparameter(UniformIntegerHyperparameter("n", 0, 10))
+        for value in (np.array([3]), np.array([3, 4]), np.array([0.5])):
+            with self.assertRaises(IllegalValueError):
+                Configuration(cs, values={"x": 0.5, "n": value})
+
     def test_keys(self):
         # A regression test to make sure issue #49 does no longer pop up. By
         # iterating over the configuration in the for loop, it should not raise
@@ -1196,6 +1391,12 @@ class ConfigurationTest(unittest.TestCase):
         d = {**config}
         assert d == values_dict
 
+        # Test membership and get
+        assert isinstance(config, Mapping)
+        assert "parent" in config
+        assert "not_a_hyperparameter" not in config
+        assert config.get("child") == 2
+
     def test_order_of_hyperparameters_is_same_as_config_space(self):
         """
         Test the keys respect the contract that they follow the same order that
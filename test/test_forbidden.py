@@ -182,6 +182,10 @@ class TestForbidden(unittest.TestCase):
         and3 = ForbiddenAndConjunction(forb2, forb5)
 
         total_and = ForbiddenAndConjunction(and1, and2, and3)
+
+        self.assertEqual(and1, ForbiddenAndConjunction(forb2, forb3))
+        self.assertNotEqual(and1, and2)
+        self.assertNotEqual(and1, ForbiddenAndConjunction(forb3, forb2))
         assert (
             str(total_and)
             == "((Forbidden: parent == 1 && Forbidden: child in {2}) && (Forbidden: parent == 1 && Forbidden: child2 in {2}) && (Forbidden: parent == 1 && Forbidden: child3 in {2}))"
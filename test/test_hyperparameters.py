@@ -28,8 +28,10 @@
 from __future__ import annotations
 
 import copy
+import pickle
 import unittest
 from collections import defaultdict
+from itertools import product
 from typing import Any
 
 import numpy as np
@@ -47,6 +49,7 @@ from ConfigSpace.hyperparameters import (
     UniformFloatHyperparameter,
     UniformIntegerHyperparameter,
 )
+from helpers import unpickle_from_other_process
 
 
 class TestHyperparameters(unittest.TestCase):
@@ -94,6 +97,15 @@ class TestHyperparameters(unittest.TestCase):
         for constant in (c1, c2, c3, c4, c5, c1_meta):
             assert constant.get_size() == 1
 
+    def test_constant_sample(self):
+        c1 = Constant("value", "a")
+        rs = np.random.RandomState(1)
+        assert c1._sample(rs) == 0
+        assert c1.sample(rs) == "a"
+        assert c1.rvs() == "a"
+        np.testing.assert_array_equal(c1._sample(rs, size=1), [0.0])
+        np.testing.assert_array_equal(c1._sample(rs, size=3), [0.0, 0.0, 0.0])
+
     def test_constant_pdf(self):
         c1 = Constant("valuee", 1)
         c2 = Constant("valueee", -2)
@@ -269,6 +281,14 @@ class TestHyperparameters(unittest.TestCase):
         assert not f1.is_legal("AAA")
         assert not f1.is_legal({})
 
+        # Test a batch of values
+        assert not f1.is_legal(np.array([3.0]))
+        np.testing.assert_array_equal(
+            f1.is_legal_array(np.array([3.0, 0.1, 10, -0.1, 10.1])),
+            [True, True, True, False, False],
+        )
+        np.testing.assert_array_equal(f1.is_legal_array(np.array(["AAA"])), [False])
+
         # Test legal vector values
         assert f1.is_legal_vector(1.0)
         assert f1.is_legal_vector(0.0)
@@ -427,6 +447,54 @@ class TestHyperparameters(unittest.TestCase):
         self.assertAlmostEqual(c2.get_max_density(), 4.539992976248485e-05)
         assert c3.get_max_density() == 2
 
+    def test_uniformfloat_transform_vector_does_not_modify_input(self):
+        hps = [
+            UniformFloatHyperparameter("param", lower=-3, upper=7),
+            UniformFloatHyperparameter("logparam", lower=1e-5, upper=10, log=True),
+            UniformFloatHyperparameter("qparam", lower=1, upper=1000, q=0.5, log=True),
+        ]
+        for hp in hps:
+            vector = np.linspace(0, 1, 101)
+            original = vector.copy()
+
+            values = hp._transform_vector(vector)
+            np.testing.assert_array_equal(vector, original)
+            np.testing.assert_array_equal(values, [hp._transform_scalar(v) for v in original])
+
+            normalized = hp._inverse_transform(values)
+            np.testing.assert_array_equal(values, hp._transform_vector(original))
+            np.testing.assert_allclose(normalized, [hp._inverse_transform(v) for v in values])
+
+    def test_uniformfloat_get_neighbors_matches_scalar_draws(self):
+        # Neighbors are drawn in batches, the neighbors and the state the random state is
+        # left in must be the same as when drawing them one by one
+        def scalar_neighbors(hp, value, rs, number, transform, std):
+            neighbors = []
+            while len(neighbors) < number:
+                neighbor = rs.normal(value, std)
+                if neighbor < 0 or neighbor > 1:
+                    continue
+                if transform:
+                    neighbors.append(hp._transform(neighbor))
+                else:
+                    neighbors.append(neighbor)
+            return neighbors
+
+        hp = UniformFloatHyperparameter("param", lower=1e-3, upper=10, log=True)
+        for seed, value, number, transform, std in product(
+            range(5),
+            [0.01, 0.5, 0.99],
+            [1, 4, 10],
+            [False, True],
+            [0.2, 1.0],
+        ):
+            rs = np.random.RandomState(seed)
+            expected_rs = np.random.RandomState(seed)
+            neighbors = hp.get_neighbors(value, rs, number=number, transform=transform, std=std)
+            expected = scalar_neighbors(hp, value, expected_rs, number, transform, std)
+            assert neighbors == expected
+            np.testing.assert_equal(rs.get_state(), expected_rs.get_state())
+
     def test_normalfloat(self):
         # TODO test non-equality
         f1 = NormalFloatHyperparameter("param", 0.5, 10.5)
@@ -1293,6 +1361,21 @@ class TestHyperparameters(unittest.TestCase):
             default_value=20.5,
         )
 
+    def test_uniformint_is_legal(self):
+        f1 = UniformIntegerHyperparameter("param", 1, 10)
+        assert f1.is_legal(1)
+        assert f1.is_legal(np.int64(10))
+        assert not f1.is_legal(0)
+        assert not f1.is_legal(5.0)
+
+        # Test a batch of values
+        assert not f1.is_legal(np.array([5]))
+        np.testing.assert_array_equal(
+            f1.is_legal_array(np.array([1, 5, 10, 0, 11])),
+            [True, True, True, False, False],
+        )
+        np.testing.assert_array_equal(f1.is_legal_array(np.array([5.0])), [False])
+
     def test_uniformint_illegal_bounds(self):
         self.assertRaisesRegex(
             ValueError,
@@ -1447,6 +1530,12 @@ class TestHyperparameters(unittest.TestCase):
                 neighbors = c1.get_neighbors(float_value, rs, number=i_upper, transform=True)
                 assert set(neighbors) == set(range(i_upper + 1)) - {i_value}
 
+        c2 = UniformIntegerHyperparameter("param", lower=0, upper=10, q=5)
+        for i_value in (0, 5, 10):
+            float_value = c2._inverse_transform(i_value)
+            neighbors = c2.get_neighbors(float_value, rs, number=4, transform=True)
+            assert set(neighbors) == {0, 5, 10} - {i_value}
+
     def test_normalint(self):
         # TODO test for unequal!
         f1 = NormalIntegerHyperparameter("param", 0.5, 5.5)
@@ -2212,6 +2301,11 @@ class TestHyperparameters(unittest.TestCase):
         c2 = CategoricalHyperparameter("param", ["b", "a"], weights=[1, 2], default_value="a")
         assert c1 != c2
 
+        c1 = CategoricalHyperparameter("param", ["a", "b", "c"], default_value="a")
+        c2 = CategoricalHyperparameter("param", ["c", "b", "a"], default_value="a")
+        assert c1 == c2
+        assert hash(c1) == hash(c2)
+
         # Test that the equals operator does not fail accessing the weight of choice "a" in c2
         c1 = CategoricalHyperparameter("param", ["a", "b"], weights=[1, 2])
         c2 = CategoricalHyperparameter("param", ["b", "c"], weights=[1, 2])
@@ -2223,12 +2317,100 @@ class TestHyperparameters(unittest.TestCase):
         assert f1 == f1_
         assert str(f1) == "param, Type: Categorical, Choices: {a, b}, Default: a"
 
+    def test_categorical_get_neighbors(self):
+        f1 = CategoricalHyperparameter("param", ["a", "b", "c", "d", "e"])
+        rs = np.random.RandomState(1)
+        for value in range(5):
+            for number in range(1, 5):
+                neighbors = f1.get_neighbors(value, rs, number=number)
+                assert len(neighbors) == len(set(neighbors)) == number
+                assert float(value) not in neighbors
+                assert all(isinstance(neighbor, float) for neighbor in neighbors)
+
+            neighbors = f1.get_neighbors(value, rs, number=2, transform=True)
+            assert len(set(neighbors)) == 2
+            assert f1.choices[value] not in neighbors
+            assert set(f1.get_neighbors(value, rs)) == set(range(5)) - {value}
+
+        assert f1.get_neighbors(1, rs) == [0.0, 2.0, 3.0, 4.0]
+        assert f1.get_neighbors(1, rs, transform=True) == ["a", "c", "d", "e"]
+
+        f2 = CategoricalHyperparameter("param", [True, False])
+        for number in (1, 2, np.inf):
+            assert f2.get_neighbors(0, rs, number=number) == [1.0]
+            assert f2.get_neighbors(1.0, rs, number=number) == [0.0]
+            assert f2.get_neighbors(0, rs, number=number, transform=True) == [False]
+        assert f2.get_neighbors(0, rs, number=0) == []
+
+    def test_categorical_get_neighbors_binary(self):
+        # Binary choices take a shortcut, it must give the same neighbors and leave the
+        # random state as the general path, which draws one random number per neighbor
+        # if not all neighbors are requested
+        f1 = CategoricalHyperparameter("param", [True, False])
+        for seed, value, number, transform in product(
+            range(3),
+            [0, 1, 0.0, 1.0],
+            [0, 1, 2, np.inf],
+            [False, True],
+        ):
+            rs = np.random.RandomState(seed)
+            expected_rs = np.random.RandomState(seed)
+            neighbors = f1.get_neighbors(value, rs, number=number, transform=transform)
+
+            if number == 0:
+                expected = []
+            else:
+                other = 1 - int(value)
+                expected = [f1.choices[other]] if transform else [float(other)]
+            if number < 2:
+                expected_rs.random(size=int(number))
+
+            assert neighbors == expected
+            assert all(type(n) is type(e) for n, e in zip(neighbors, expected))
+            np.testing.assert_equal(rs.get_state(), expected_rs.get_state())
+
+    def test_categorical_get_neighbors_distribution(self):
+        # Neighbors are drawn without replacement, uniformly among all other choices
+        f1 = CategoricalHyperparameter("param", ["a", "b", "c", "d", "e", "f"])
+        value = 2
+        n_seeds = 3000
+        counts = defaultdict(int)
+        pair_counts = defaultdict(int)
+        for seed in range(n_seeds):
+            neighbors = f1.get_neighbors(value, np.random.RandomState(seed), number=2)
+            assert len(neighbors) == len(set(neighbors)) == 2
+            assert float(value) not in neighbors
+            for neighbor in neighbors:
+                counts[neighbor] += 1
+            pair_counts[frozenset(neighbors)] += 1
+
+        # Each of the 5 other choices is drawn in 2 of 5 cases, each of the 10 pairs in
+        # 1 of 10 cases
+        assert set(counts) == {0.0, 1.0, 3.0, 4.0, 5.0}
+        for count in counts.values():
+            assert abs(count - n_seeds * 2 / 5) < 0.1 * n_seeds * 2 / 5
+        assert len(pair_counts) == 10
+        for count in pair_counts.values():
+            assert abs(count - n_seeds / 10) < 0.2 * n_seeds / 10
+
+    def test_categorical_transform_numeric_choices(self):
+        # Choices of a single numeric type are returned in typed arrays
+        c1 = CategoricalHyperparameter("batch_size", [256, 512, 1024])
+        transformed = c1._transform(np.array([2.0, 0.0]))
+        np.testing.assert_array_equal(transformed, [1024, 256])
+        assert transformed.dtype.kind == "i"
+        c2 = CategoricalHyperparameter("rate", [0.1, 0.01])
+        assert c2._transform(np.array([1.0])).dtype.kind == "f"
+        c3 = CategoricalHyperparameter("mixed", [1, 0.5])
+        assert c3._transform(np.array([0.0])).dtype == object
+
     def test_categorical_is_legal(self):
         f1 = CategoricalHyperparameter("param", ["a", "b"])
         assert f1.is_legal("a")
         assert f1.is_legal("a")
         assert not f1.is_legal("c")
         assert not f1.is_legal(3)
+        assert not f1.is_legal(["a"])
 
         # Test is legal vector
         assert f1.is_legal_vector(1.0)
@@ -2791,6 +2973,30 @@ class TestHyperparameters(unittest.TestCase):
             (0.3333333333333333, 0.3333333333333333, 0.3333333333333333),
         )
 
+    def test_categorical_and_ordinal_pickle(self):
+        hyperparameters = [
+            CategoricalHyperparameter("c", ["red", "green", "blue"], "green", weights=[1, 2, 3]),
+            OrdinalHyperparameter("o", ["cold", "warm", "hot"], "warm", meta={"a": 1}),
+        ]
+        for hp in hyperparameters:
+            unpickled = pickle.loads(pickle.dumps(hp))  # noqa: S301
+            assert unpickled == hp
+            assert hash(unpickled) == hash(hp)
+            assert unpickled.meta == hp.meta
+
+        # Hashes of strings are salted per process, a hyperparameter pickled in another
+        # process must not carry its hash along
+        unpickled_hyperparameters = unpickle_from_other_process(
+            "from ConfigSpace import CategoricalHyperparameter, OrdinalHyperparameter\n"
+            "obj = [\n"
+            "    CategoricalHyperparameter('c', ['red', 'green', 'blue'], 'green', weights=[1, 2, 3]),\n"
+            "    OrdinalHyperparameter('o', ['cold', 'warm', 'hot'], 'warm', meta={'a': 1}),\n"
+            "]\n",
+        )
+        for unpickled, hp in zip(unpickled_hyperparameters, hyperparameters):
+            assert unpickled == hp
+            assert unpickled in {hp}
+
     def test_categorical_with_weights(self):
         rs = np.random.RandomState()
 
@@ -2949,12 +3155,15 @@ class TestHyperparameters(unittest.TestCase):
         assert not f1.is_legal("chill")
         assert not f1.is_legal(2.5)
         assert not f1.is_legal("3")
+        assert not f1.is_legal(["warm"])
 
         # Test is legal vector
         assert f1.is_legal_vector(1.0)
         assert f1.is_legal_vector(0.0)
         assert f1.is_legal_vector(0)
         assert f1.is_legal_vector(3)
+        assert not f1.is_legal_vector(4)
+        assert not f1.is_legal_vector(1.5)
         assert not f1.is_legal_vector(-0.1)
         self.assertRaises(TypeError, f1.is_legal_vector, "Hahaha")
 
@@ -2964,17 +3173,32 @@ class TestHyperparameters(unittest.TestCase):
         assert f1.check_order("freezing", "hot")
         assert not f1.check_order("hot", "cold")
         assert not f1.check_order("hot", "warm")
+        assert not f1.check_order("warm", "warm")
+        assert f1.compare("freezing", "hot") == -1
+        assert f1.compare("hot", "cold") == 1
+        assert f1.compare("warm", "warm") == 0
 
     def test_ordinal_get_value(self):
         f1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
         assert f1.get_value(3) == "hot"
         assert f1.get_value(1) != "warm"
+        assert f1.get_value(2.0) == "warm"
+        self.assertRaises(ValueError, f1.get_value, 4)
+        self.assertRaises(ValueError, f1.get_value, -1)
 
     def test_ordinal_get_order(self):
         f1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
         assert f1.get_order("warm") == 2
         assert f1.get_order("freezing") != 3
 
+    def test_ordinal_inverse_transform(self):
+        f1 = OrdinalHyperparameter("param", [1, 1.5, "a", (2, 3)])
+        for idx, value in enumerate(f1.sequence):
+            assert f1._inverse_transform(value) == idx == f1.get_order(value)
+            assert f1._transform(f1._inverse_transform(value)) == value
+        assert np.isnan(f1._inverse_transform(None))
+        self.assertRaises(ValueError, f1._inverse_transform, "b")
+
     def test_ordinal_get_seq_order(self):
         f1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
         assert tuple(f1.get_seq_order()) == (0, 1, 2, 3)
@@ -2987,6 +3211,15 @@ class TestHyperparameters(unittest.TestCase):
         assert f1.get_neighbors("hot", transform=True, rs=None) == ["warm"]
         assert f1.get_neighbors("cold", transform=True, rs=None) == ["freezing", "warm"]
 
+        # Repeated lookups are served from a cache but must return independent lists
+        neighbors = f1.get_neighbors(1, rs=None)
+        neighbors.pop()
+        assert f1.get_neighbors(1, rs=None) == [0, 2]
+        # 1 and 1.0 hash equally, but the neighbors keep the type of the value
+        neighbors = f1.get_neighbors(1.0, rs=None)
+        assert neighbors == [0.0, 2.0]
+        assert all(isinstance(neighbor, float) for neighbor in neighbors)
+
     def test_get_num_neighbors(self):
         f1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
         assert f1.get_num_neighbors("freezing") == 1
@@ -3081,6 +3314,24 @@ class TestHyperparameters(unittest.TestCase):
         f1.rvs(random_state=np.random.default_rng(1))
         self.assertRaises(ValueError, f1.rvs, 1, "a")
 
+        o1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
+        assert o1.rvs(random_state=np.random.default_rng(1)) in o1.sequence
+        indices = o1._sample(np.random.default_rng(1), size=5)
+        assert indices.shape == (5,) and ((indices >= 0) & (indices < 4)).all()
+        c1 = CategoricalHyperparameter("param", ["a", "b", "c"])
+        neighbors = c1.get_neighbors(0, np.random.default_rng(1), number=1)
+        assert neighbors[0] in (1.0, 2.0)
+
+    def test_categorical_and_ordinal_rvs(self):
+        # Categorical and ordinal hyperparameters return arrays of their values
+        c1 = CategoricalHyperparameter("param", ["a", "b", "c"])
+        o1 = OrdinalHyperparameter("temp", ["freezing", "cold", "warm", "hot"])
+        for hp, values in ((c1, c1.choices), (o1, o1.sequence)):
+            samples = hp.rvs(size=5, random_state=1)
+            assert isinstance(samples, np.ndarray) and samples.shape == (5,)
+            assert all(sample in values for sample in samples)
+            assert hp.rvs(random_state=1) in values
+
     def test_hyperparam_representation(self):
         # Float
         f1 = UniformFloatHyperparameter("param", 1, 100, log=True)